@@ -88,7 +88,7 @@ def example_rakuda_save_worker() -> None:
     # 実行後、以下のファイルが生成される:
     # - data/experiment_01/rakuda_observations.h5  # 主要データ
     # - data/experiment_01/arm_obs.png             # 腕観測の可視化
-    # - data/experiment_01/rakuda_obs_animation.gif # アニメーション（オプション）
+    # - data/experiment_01/rakuda_obs_animation.mp4 # アニメーション（オプション, ffmpeg が無い場合は .gif）
 
     print("✓ Example RakudaSaveWorker usage (commented for demo)")
     print("  Main output: rakuda_observations.h5")
@@ -23,7 +23,7 @@ class RakudaConfig:
     follower_torque_enabled: List[str] | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class RakudaSensorParams:
     cameras: List[CameraParams] = field(default_factory=list)
     tactile: List[TactileParams] = field(default_factory=list)
@@ -37,20 +37,20 @@ class RakudaSensorConfigs:
     audio: List[AudioParams]
 
 
-@dataclass
+@dataclass(slots=True)
 class RakudaArmObs:
     leader: NDArray[np.float32]
     follower: NDArray[np.float32]
 
 
-@dataclass
+@dataclass(slots=True)
 class RakudaSensorObs:
     cameras: Dict[str, NDArray[np.float32] | None]
     tactile: Dict[str, NDArray[np.float32] | None]
     audio: Dict[str, NDArray[np.float32] | None]
 
 
-@dataclass
+@dataclass(slots=True)
 class RakudaObs:
     """
     Overall observation structure for Rakuda robot.
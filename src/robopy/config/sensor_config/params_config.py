@@ -1,7 +1,7 @@
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True)
 class CameraParams:
     name: str
     width: int
@@ -10,14 +10,14 @@ class CameraParams:
     index: int = 0  # Add index attribute for RealSense camera
 
 
-@dataclass
+@dataclass(slots=True)
 class TactileParams:
     serial_num: str
     name: str = "main"
     fps: int | None = 30
 
 
-@dataclass
+@dataclass(slots=True)
 class AudioParams:
     name: str = "main"
     fps: int | None = 30
@@ -0,0 +1,55 @@
+from typing import Any
+
+import numpy as np
+from numpy.typing import NDArray
+
+
+class FrameBuffer:
+    """Preallocated storage for one sensor stream of a recording.
+
+    The backing array of shape (max_frames, *frame.shape) is allocated when the first
+    frame arrives, and every later frame is copied into its slot. This avoids keeping
+    a Python list of per-frame arrays and stacking it into a second full-size copy
+    once recording ends. Written slots are tracked, so a stream that starts late or
+    skips an index is reported as incomplete instead of returning unwritten memory.
+    """
+
+    def __init__(self, max_frames: int) -> None:
+        self._max_frames = max_frames
+        self._data: NDArray[Any] | None = None
+        self._written = np.zeros(max_frames, dtype=bool)
+        self._complete = True
+
+    def put(self, index: int, frame: NDArray[Any] | None) -> None:
+        """Store ``frame`` as frame ``index``. A missing frame invalidates the stream.
+
+        Args:
+            index (int): Frame index, in [0, max_frames).
+            frame (NDArray[Any] | None): Frame data, or None if the sensor returned nothing.
+        """
+        if frame is None:
+            self._complete = False
+            return
+        if self._data is None:
+            self._data = np.empty((self._max_frames, *frame.shape), dtype=frame.dtype)
+        self._data[index] = frame
+        self._written[index] = True
+
+    def result(self, num_frames: int) -> NDArray[Any] | None:
+        """Return the first ``num_frames`` frames.
+
+        Args:
+            num_frames (int): Number of frames actually recorded.
+
+        Returns:
+            NDArray[Any] | None: Array of shape (num_frames, ...), or None if no frame was
+                recorded or any of the first ``num_frames`` frames was missing.
+        """
+        if self._data is None or not self._complete or num_frames == 0:
+            return None
+        if not self._written[:num_frames].all():
+            return None
+        if num_frames < self._max_frames:
+            # Recording stopped early: do not keep the unused tail of the buffer alive.
+            return self._data[:num_frames].copy()
+        return self._data
@@ -3,7 +3,7 @@ import threading
 import time
 from collections import defaultdict
 from logging import getLogger
-from typing import ClassVar, DefaultDict, Dict, List
+from typing import ClassVar, Dict, List
 
 import numpy as np
 from numpy.typing import NDArray
@@ -22,6 +22,7 @@ from robopy.config.sensor_config.visual_config.camera_config import (
 from robopy.kinematics import EEPose, IKConfig, IKResult, IKSolver, koch_chain
 from robopy.kinematics.chain import KinematicChain
 from robopy.robots.common.composed import ComposedRobot
+from robopy.robots.common.frame_buffer import FrameBuffer
 from robopy.sensors.visual.realsense_camera import RealsenseCamera
 from robopy.sensors.visual.web_camera import WebCamera
 from robopy.utils.worker.koch_save_worker import KochArmObs, KochObs
@@ -95,9 +96,7 @@ class KochRobot(ComposedRobot[KochPairSys, Sensors, KochObs]):
 
         leader_obs: List[NDArray[np.float32]] = []
         follower_obs: List[NDArray[np.float32]] = []
-        camera_obs: DefaultDict[str, List[NDArray[np.float32] | NDArray[np.uint8] | None]] = (
-            defaultdict(list)
-        )
+        camera_obs: Dict[str, FrameBuffer] = defaultdict(lambda: FrameBuffer(max_frame))
 
         interval = 1.0 / fps
         frame_start = time.perf_counter()
@@ -108,12 +107,13 @@ class KochRobot(ComposedRobot[KochPairSys, Sensors, KochObs]):
                 if arm_obs is None:
                     continue
 
+                frame_index = len(leader_obs)
                 leader_obs.append(arm_obs.leader)
                 follower_obs.append(arm_obs.follower)
 
                 sensor_data = self.sensors_observation()
                 for cam_name, frame in sensor_data.items():
-                    camera_obs[cam_name].append(frame)
+                    camera_obs[cam_name].put(frame_index, frame)
 
                 elapsed = time.perf_counter() - frame_start
                 sleep_time = interval - elapsed
@@ -132,12 +132,9 @@ class KochRobot(ComposedRobot[KochPairSys, Sensors, KochObs]):
         follower_arr = np.asarray(follower_obs, dtype=np.float32)
         arms = KochArmObs(leader=leader_arr, follower=follower_arr)
 
-        camera_obs_np: Dict[str, NDArray[np.uint8] | NDArray[np.float32] | None] = {}
-        for cam_name, frames in camera_obs.items():
-            if frames and all(frame is not None for frame in frames):
-                camera_obs_np[cam_name] = np.asarray(frames)
-            else:
-                camera_obs_np[cam_name] = None
+        camera_obs_np: Dict[str, NDArray[np.uint8] | NDArray[np.float32] | None] = {
+            cam_name: buffer.result(len(leader_obs)) for cam_name, buffer in camera_obs.items()
+        }
 
         return KochObs(arms=arms, cameras=camera_obs_np)
 
@@ -182,9 +179,7 @@ class KochRobot(ComposedRobot[KochPairSys, Sensors, KochObs]):
 
         leader_obs: List[NDArray[np.float32]] = []
         follower_obs: List[NDArray[np.float32]] = []
-        camera_obs: DefaultDict[str, List[NDArray[np.float32] | NDArray[np.uint8] | None]] = (
-            defaultdict(list)
-        )
+        camera_obs: Dict[str, FrameBuffer] = defaultdict(lambda: FrameBuffer(max_frame))
 
         get_obs_interval = 1.0 / fps
         max_processing_time = max_processing_time_ms / 1000.0
@@ -221,7 +216,7 @@ class KochRobot(ComposedRobot[KochPairSys, Sensors, KochObs]):
                     follower_obs.append(arm_obs.follower)
 
                     for cam_name, frame in sensor_data.items():
-                        camera_obs[cam_name].append(frame)
+                        camera_obs[cam_name].put(frame_count, frame)
 
                     frame_count += 1
                     progress.update(task, advance=1)
@@ -268,12 +263,9 @@ class KochRobot(ComposedRobot[KochPairSys, Sensors, KochObs]):
         follower_arr = np.asarray(follower_obs, dtype=np.float32)
         arms = KochArmObs(leader=leader_arr, follower=follower_arr)
 
-        camera_obs_np: Dict[str, NDArray[np.uint8] | NDArray[np.float32] | None] = {}
-        for cam_name, frames in camera_obs.items():
-            if frames and all(frame is not None for frame in frames):
-                camera_obs_np[cam_name] = np.asarray(frames)
-            else:
-                camera_obs_np[cam_name] = None
+        camera_obs_np: Dict[str, NDArray[np.uint8] | NDArray[np.float32] | None] = {
+            cam_name: buffer.result(frame_count) for cam_name, buffer in camera_obs.items()
+        }
 
         return KochObs(arms=arms, cameras=camera_obs_np)
 
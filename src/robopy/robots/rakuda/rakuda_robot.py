@@ -27,6 +27,7 @@ from robopy.sensors.tactile import DigitSensor
 from robopy.sensors.visual import RealsenseCamera
 
 from ..common.composed import ComposedRobot
+from ..common.frame_buffer import FrameBuffer
 from .rakuda_pair_sys import RakudaPairSys
 
 logger = getLogger(__name__)
@@ -78,9 +79,9 @@ class RakudaRobot(ComposedRobot[RakudaPairSys, Sensors, RakudaObs]):
 
         leader_obs: List[NDArray[np.float32]] = []
         follower_obs: List[NDArray[np.float32]] = []
-        camera_obs: Dict[str, List[NDArray[np.float32] | None]] = defaultdict(list)
-        tactile_obs: Dict[str, List[NDArray[np.float32] | None]] = defaultdict(list)
-        audio_obs: Dict[str, List[NDArray[np.float32] | None]] = defaultdict(list)
+        camera_obs: Dict[str, FrameBuffer] = defaultdict(lambda: FrameBuffer(max_frame))
+        tactile_obs: Dict[str, FrameBuffer] = defaultdict(lambda: FrameBuffer(max_frame))
+        audio_obs: Dict[str, FrameBuffer] = defaultdict(lambda: FrameBuffer(max_frame))
 
         get_obs_interval = 1.0 / fps
         frame_count = 0
@@ -103,13 +104,13 @@ class RakudaRobot(ComposedRobot[RakudaPairSys, Sensors, RakudaObs]):
                 audio_data = sensor_data.audio
 
                 for cam_name, cam_frame in camera_data.items():
-                    camera_obs[cam_name].append(cam_frame)
+                    camera_obs[cam_name].put(frame_count, cam_frame)
 
                 for tac_name, tac_frame in tactile_data.items():
-                    tactile_obs[tac_name].append(tac_frame)
+                    tactile_obs[tac_name].put(frame_count, tac_frame)
 
                 for audio_name, audio_frame in audio_data.items():
-                    audio_obs[audio_name].append(audio_frame)
+                    audio_obs[audio_name].put(frame_count, audio_frame)
 
                 frame_count += 1
                 interval_start = time.time()
@@ -126,27 +127,18 @@ class RakudaRobot(ComposedRobot[RakudaPairSys, Sensors, RakudaObs]):
         arms: RakudaArmObs = RakudaArmObs(leader=leader_obs_np, follower=follower_obs_np)
         # process camera observations
         camera_obs_np: Dict[str, NDArray[np.float32] | None] = {}
-        for cam_name, frames in camera_obs.items():
-            if frames:
-                camera_obs_np[cam_name] = np.array(frames)
-            else:
-                camera_obs_np[cam_name] = None
+        for cam_name, buffer in camera_obs.items():
+            camera_obs_np[cam_name] = buffer.result(frame_count)
 
         # process tactile observations
         tactile_obs_np: Dict[str, NDArray[np.float32] | None] = {}
-        for tac_name, frames in tactile_obs.items():
-            if frames:
-                tactile_obs_np[tac_name] = np.array(frames)
-            else:
-                tactile_obs_np[tac_name] = None
+        for tac_name, buffer in tactile_obs.items():
+            tactile_obs_np[tac_name] = buffer.result(frame_count)
 
         # process audio observations
         audio_obs_np: Dict[str, NDArray[np.float32] | None] = {}
-        for audio_name, frames in audio_obs.items():
-            if frames:
-                audio_obs_np[audio_name] = np.array(frames)
-            else:
-                audio_obs_np[audio_name] = None
+        for audio_name, buffer in audio_obs.items():
+            audio_obs_np[audio_name] = buffer.result(frame_count)
 
         sensors_obs = RakudaSensorObs(
             cameras=camera_obs_np, tactile=tactile_obs_np, audio=audio_obs_np
@@ -193,9 +185,9 @@ class RakudaRobot(ComposedRobot[RakudaPairSys, Sensors, RakudaObs]):
 
         leader_obs: List[NDArray[np.float32]] = []
         follower_obs: List[NDArray[np.float32]] = []
-        camera_obs: Dict[str, List[NDArray[np.float32] | None]] = defaultdict(list)
-        tactile_obs: Dict[str, List[NDArray[np.float32] | None]] = defaultdict(list)
-        audio_obs: Dict[str, List[NDArray[np.float32] | None]] = defaultdict(list)
+        camera_obs: Dict[str, FrameBuffer] = defaultdict(lambda: FrameBuffer(max_frame))
+        tactile_obs: Dict[str, FrameBuffer] = defaultdict(lambda: FrameBuffer(max_frame))
+        audio_obs: Dict[str, FrameBuffer] = defaultdict(lambda: FrameBuffer(max_frame))
 
         get_obs_interval = 1.0 / fps
         max_processing_time = max_processing_time_ms / 1000.0
@@ -291,13 +283,13 @@ class RakudaRobot(ComposedRobot[RakudaPairSys, Sensors, RakudaObs]):
                     follower_obs.append(arm_obs.follower)
 
                     for cam_name, cam_frame in camera_data.items():
-                        camera_obs[cam_name].append(cam_frame)
+                        camera_obs[cam_name].put(frame_count, cam_frame)
 
                     for tac_name, tac_frame in tactile_data.items():
-                        tactile_obs[tac_name].append(tac_frame)
+                        tactile_obs[tac_name].put(frame_count, tac_frame)
 
                     for audio_name, audio_frame in audio_data.items():
-                        audio_obs[audio_name].append(audio_frame)
+                        audio_obs[audio_name].put(frame_count, audio_frame)
 
                     frame_count += 1
                     logger.info("Recording progress: %s/%s frames", frame_count, max_frame)
@@ -341,25 +333,17 @@ class RakudaRobot(ComposedRobot[RakudaPairSys, Sensors, RakudaObs]):
         arms: RakudaArmObs = RakudaArmObs(leader=leader_obs_np, follower=follower_obs_np)
 
         camera_obs_np: Dict[str, NDArray[np.float32] | None] = {}
-        for cam_name, frames in camera_obs.items():
-            if frames and all(frame is not None for frame in frames):
-                camera_obs_np[cam_name] = np.array(frames)
-            else:
-                camera_obs_np[cam_name] = None
+        for cam_name, buffer in camera_obs.items():
+            camera_obs_np[cam_name] = buffer.result(frame_count)
 
         tactile_obs_np: Dict[str, NDArray[np.float32] | None] = {}
-        for tac_name, frames in tactile_obs.items():
-            if frames and all(frame is not None for frame in frames):
-                tactile_obs_np[tac_name] = np.array(frames).transpose(0, 3, 1, 2)
-            else:
-                tactile_obs_np[tac_name] = None
+        for tac_name, buffer in tactile_obs.items():
+            frames = buffer.result(frame_count)
+            tactile_obs_np[tac_name] = None if frames is None else frames.transpose(0, 3, 1, 2)
 
         audio_obs_np: Dict[str, NDArray[np.float32] | None] = {}
-        for audio_name, frames in audio_obs.items():
-            if frames and all(frame is not None for frame in frames):
-                audio_obs_np[audio_name] = np.array(frames)
-            else:
-                audio_obs_np[audio_name] = None
+        for audio_name, buffer in audio_obs.items():
+            audio_obs_np[audio_name] = buffer.result(frame_count)
 
         sensors_obs = RakudaSensorObs(
             cameras=camera_obs_np, tactile=tactile_obs_np, audio=audio_obs_np
@@ -431,9 +415,9 @@ class RakudaRobot(ComposedRobot[RakudaPairSys, Sensors, RakudaObs]):
 
         leader_obs = []
         follower_obs = []
-        camera_obs: Dict[str, List] = defaultdict(list)
-        tactile_obs: Dict[str, List] = defaultdict(list)
-        audio_obs: Dict[str, List] = defaultdict(list)
+        camera_obs: Dict[str, FrameBuffer] = defaultdict(lambda: FrameBuffer(max_frame))
+        tactile_obs: Dict[str, FrameBuffer] = defaultdict(lambda: FrameBuffer(max_frame))
+        audio_obs: Dict[str, FrameBuffer] = defaultdict(lambda: FrameBuffer(max_frame))
 
         get_obs_interval = 1.0 / fps
         max_processing_time = max_processing_time_ms / 1000.0
@@ -526,13 +510,13 @@ class RakudaRobot(ComposedRobot[RakudaPairSys, Sensors, RakudaObs]):
                     follower_obs.append(current_follower)
 
                     for cam_name, cam_frame in camera_data.items():
-                        camera_obs[cam_name].append(cam_frame)
+                        camera_obs[cam_name].put(frame_count, cam_frame)
 
                     for tac_name, tac_frame in tactile_data.items():
-                        tactile_obs[tac_name].append(tac_frame)
+                        tactile_obs[tac_name].put(frame_count, tac_frame)
 
                     for audio_name, audio_frame in audio_data.items():
-                        audio_obs[audio_name].append(audio_frame)
+                        audio_obs[audio_name].put(frame_count, audio_frame)
 
                     frame_count += 1
 
@@ -575,25 +559,17 @@ class RakudaRobot(ComposedRobot[RakudaPairSys, Sensors, RakudaObs]):
         arms: RakudaArmObs = RakudaArmObs(leader=leader_obs_np, follower=follower_obs_np)
 
         camera_obs_np: Dict[str, NDArray[np.float32] | None] = {}
-        for cam_name, frames in camera_obs.items():
-            if frames and all(frame is not None for frame in frames):
-                camera_obs_np[cam_name] = np.array(frames)
-            else:
-                camera_obs_np[cam_name] = None
+        for cam_name, buffer in camera_obs.items():
+            camera_obs_np[cam_name] = buffer.result(frame_count)
 
         tactile_obs_np: Dict[str, NDArray[np.float32] | None] = {}
-        for tac_name, frames in tactile_obs.items():
-            if frames and all(frame is not None for frame in frames):
-                tactile_obs_np[tac_name] = np.array(frames).transpose(0, 3, 1, 2)
-            else:
-                tactile_obs_np[tac_name] = None
+        for tac_name, buffer in tactile_obs.items():
+            frames = buffer.result(frame_count)
+            tactile_obs_np[tac_name] = None if frames is None else frames.transpose(0, 3, 1, 2)
 
         audio_obs_np: Dict[str, NDArray[np.float32] | None] = {}
-        for audio_name, frames in audio_obs.items():
-            if frames and all(frame is not None for frame in frames):
-                audio_obs_np[audio_name] = np.array(frames)
-            else:
-                audio_obs_np[audio_name] = None
+        for audio_name, buffer in audio_obs.items():
+            audio_obs_np[audio_name] = buffer.result(frame_count)
 
         sensors_obs = RakudaSensorObs(
             cameras=camera_obs_np, tactile=tactile_obs_np, audio=audio_obs_np
@@ -7,7 +7,7 @@ import queue
 import threading
 import time
 from collections import defaultdict
-from typing import DefaultDict, Dict, List
+from typing import Dict, List
 
 import numpy as np
 from numpy.typing import NDArray
@@ -16,6 +16,7 @@ from rich.progress import Progress
 from robopy.config.input_config.spacemouse_config import SpaceMouseConfig
 from robopy.input.spacemouse import SpaceMouseReader
 from robopy.kinematics.ik_solver import IKConfig
+from robopy.robots.common.frame_buffer import FrameBuffer
 from robopy.utils.worker.so101_save_worker import So101ArmObs, So101Obs
 
 from .so101_robot import So101Robot
@@ -241,9 +242,7 @@ class So101SpaceMouseController:
         # Main thread: capture sensor data at *fps*
         leader_obs: List[NDArray[np.float32]] = []
         follower_obs: List[NDArray[np.float32]] = []
-        camera_obs: DefaultDict[str, List[NDArray[np.float32] | NDArray[np.uint8] | None]] = (
-            defaultdict(list)
-        )
+        camera_obs: Dict[str, FrameBuffer] = defaultdict(lambda: FrameBuffer(max_frame))
 
         get_obs_interval = 1.0 / fps
         max_processing_time = max_processing_time_ms / 1000.0
@@ -282,7 +281,7 @@ class So101SpaceMouseController:
                     follower_obs.append(arm_obs.follower)
 
                     for cam_name, frame in sensor_data.items():
-                        camera_obs[cam_name].append(frame)
+                        camera_obs[cam_name].put(frame_count, frame)
 
                     frame_count += 1
                     progress.update(task, advance=1)
@@ -329,12 +328,9 @@ class So101SpaceMouseController:
         follower_arr = np.asarray(follower_obs, dtype=np.float32)
         arms = So101ArmObs(leader=leader_arr, follower=follower_arr)
 
-        camera_obs_np: Dict[str, NDArray[np.uint8] | NDArray[np.float32] | None] = {}
-        for cam_name, frames in camera_obs.items():
-            if frames and all(f is not None for f in frames):
-                camera_obs_np[cam_name] = np.asarray(frames)
-            else:
-                camera_obs_np[cam_name] = None
+        camera_obs_np: Dict[str, NDArray[np.uint8] | NDArray[np.float32] | None] = {
+            cam_name: buffer.result(frame_count) for cam_name, buffer in camera_obs.items()
+        }
 
         return So101Obs(arms=arms, cameras=camera_obs_np)
 
@@ -1,19 +1,19 @@
 from __future__ import annotations
 
+from importlib import import_module
 from typing import TYPE_CHECKING, Any
 
-from .blosc_handler import BLOSCHandler
 from .exp_interface.meta_data_config import MetaDataConfig
-from .find_usb_port import find_port
-from .h5_handler import H5Handler
-from .worker.koch_save_worker import KochSaveWorker
-from .worker.rakuda_save_worker import RakudaSaveWorker
-from .worker.save_worker import SaveWorker
 
 if TYPE_CHECKING:
-    from .exp_interface.exp_handler import ExpHandler
+    from .blosc_handler import BLOSCHandler
     from .exp_interface.koch_exp_handler import KochExpHandler
     from .exp_interface.rakuda_exp_handler import RakudaExpHandler
+    from .find_usb_port import find_port
+    from .h5_handler import H5Handler
+    from .worker.koch_save_worker import KochSaveWorker
+    from .worker.rakuda_save_worker import RakudaSaveWorker
+    from .worker.save_worker import SaveWorker
 
 __all__ = [
     "find_port",
@@ -27,15 +27,25 @@ __all__ = [
     "MetaDataConfig",
 ]
 
-
-def __getattr__(name: str) -> type[ExpHandler[Any, Any, Any, Any]]:
-    """Lazy import for exp_interface modules to avoid circular imports."""
-    if name == "KochExpHandler":
-        from .exp_interface.koch_exp_handler import KochExpHandler
-
-        return KochExpHandler
-    if name == "RakudaExpHandler":
-        from .exp_interface.rakuda_exp_handler import RakudaExpHandler
-
-        return RakudaExpHandler
-    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+# Attributes imported on first access, so importing robopy.utils (e.g. for MetaDataConfig)
+# does not pull in blosc2, h5py, pyserial and the robot stacks.
+_LAZY_ATTRIBUTES = {
+    "find_port": ".find_usb_port",
+    "BLOSCHandler": ".blosc_handler",
+    "H5Handler": ".h5_handler",
+    "SaveWorker": ".worker.save_worker",
+    "KochSaveWorker": ".worker.koch_save_worker",
+    "RakudaSaveWorker": ".worker.rakuda_save_worker",
+    "KochExpHandler": ".exp_interface.koch_exp_handler",
+    "RakudaExpHandler": ".exp_interface.rakuda_exp_handler",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Lazy import for heavy utility modules and to avoid circular imports."""
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
@@ -1,7 +1,16 @@
+import math
+import os
 from typing import Any
 
 import blosc2
-from numpy.typing import NDArray
+from numpy.typing import DTypeLike, NDArray
+
+# Target size of one compressed chunk; small enough to stay cache friendly while
+# keeping per-chunk overhead negligible for large camera/tactile tensors.
+CHUNK_NBYTES = 2 * 1024 * 1024
+
+# Threads used inside Blosc2 for (de)compressing the blocks of a chunk.
+NTHREADS = os.cpu_count() or 1
 
 
 class BLOSCHandler:
@@ -9,18 +18,69 @@ class BLOSCHandler:
         pass
 
     @staticmethod
-    def save(data: NDArray[Any], path: str) -> None:
-        """Save data dictionary to a Blosc2 file."""
-        packed = blosc2.pack_array2(data)
-        if isinstance(packed, bytes):
-            with open(path, "wb") as f:
-                f.write(packed)
+    def save(data: NDArray[Any], path: str, codec: str = "zstd", clevel: int = 3) -> None:
+        """Save an array to a Blosc2 file.
+
+        The array is compressed chunk by chunk and streamed straight to ``path``,
+        so no full serialized copy of the array is held in memory. Multi-byte
+        dtypes use bit-shuffle and single-byte dtypes (e.g. uint8 frames) use
+        byte-shuffle ahead of the codec. Non-contiguous arrays are gathered one chunk
+        at a time, so they need not be made contiguous first.
+
+        Args:
+            data (NDArray[Any]): Array to save.
+            path (str): Destination file path.
+            codec (str): Blosc2 codec name, e.g. "zstd" or "lz4". Defaults to "zstd".
+            clevel (int): Compression level (0-9). Defaults to 3.
+
+        Raises:
+            ValueError: If ``codec`` is not a known Blosc2 codec.
+        """
+        try:
+            blosc_codec = blosc2.Codec[codec.upper()]
+        except KeyError:
+            raise ValueError(f"Unknown Blosc2 codec: {codec}") from None
+
+        shuffle = blosc2.Filter.BITSHUFFLE if data.itemsize >= 2 else blosc2.Filter.SHUFFLE
+        blosc2.asarray(
+            data,
+            urlpath=path,
+            mode="w",
+            chunks=BLOSCHandler._frame_chunks(data.shape, data.itemsize),
+            cparams=blosc2.CParams(
+                codec=blosc_codec, clevel=clevel, filters=[shuffle], nthreads=NTHREADS
+            ),
+        )
+
+    @staticmethod
+    def load(path: str, dtype: DTypeLike | None = None) -> NDArray[Any]:
+        """Load an array from a Blosc2 file.
+
+        Args:
+            path (str): Path to the Blosc2 file.
+            dtype (DTypeLike | None): Cast the loaded array to this dtype. Defaults to
+                None, which keeps the stored dtype.
+
+        Returns:
+            NDArray[Any]: Loaded array.
+        """
+        stored = blosc2.open(path, mode="r", dparams=blosc2.DParams(nthreads=NTHREADS))
+        if isinstance(stored, blosc2.NDArray):
+            data = stored[...]
         else:
-            raise ValueError("Failed to pack array: blosc2.pack_array2 returned non-bytes result")
+            # Files written with the former pack_array2 format open as a plain SChunk;
+            # decode them straight from the file without reading it into a bytes copy.
+            data = blosc2.load_array(path, dparams=blosc2.DParams(nthreads=NTHREADS))
+
+        if dtype is not None:
+            data = data.astype(dtype, copy=False)
+        return data
 
     @staticmethod
-    def load(path: str) -> NDArray[Any]:
-        """Load data dictionary from a Blosc2 file."""
-        with open(path, "rb") as f:
-            packed = f.read()
-        return blosc2.unpack_array2(packed)
+    def _frame_chunks(shape: tuple[int, ...], itemsize: int) -> tuple[int, ...] | None:
+        """Chunk along the leading (frame) axis so each chunk holds about CHUNK_NBYTES."""
+        if len(shape) == 0 or shape[0] == 0:
+            return None
+        frame_nbytes = itemsize * math.prod(shape[1:])
+        frames_per_chunk = max(1, min(shape[0], CHUNK_NBYTES // max(1, frame_nbytes)))
+        return (frames_per_chunk, *shape[1:])
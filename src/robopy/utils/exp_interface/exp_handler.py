@@ -1,6 +1,10 @@
+import dataclasses
 import json
 import os
+import re
 from abc import ABC, abstractmethod
+from collections import deque
+from functools import singledispatch
 from time import sleep
 from typing import Any, Dict, Generic, TypeVar
 
@@ -13,17 +17,81 @@ from robopy.utils.worker.save_worker import SaveWorker
 
 from .meta_data_config import MetaDataConfig
 
+try:
+    import orjson  # type: ignore
+except ImportError:
+    orjson = None
+
 ObsType = TypeVar("ObsType")
 RobotType = TypeVar("RobotType", bound=ComposedRobot[Any, Any, Any])
 ConfigType = TypeVar("ConfigType")
 WorkerType = TypeVar("WorkerType", bound=SaveWorker[Any])
 
+# Arrays larger than this are written to metadata.json as a shape/dtype summary only.
+METADATA_ARRAY_MAX_SIZE = 1024
+
+# Answers to the post-recording prompt that save the episode.
+_VALID_SAVE_KEYS: frozenset[str] = frozenset("123456789")
+
+# How _serialize_config treats a value, decided once per type.
+_LEAF, _DATACLASS, _OBJECT, _SEQUENCE, _MAPPING = range(5)
+
+
+_CONFIG_VALUE_KINDS: dict[type, int] = {}
+
+
+def _config_value_kind(cls: type) -> int:
+    """Classify instances of ``cls`` for config serialization, caching the result per type."""
+    kind = _CONFIG_VALUE_KINDS.get(cls)
+    if kind is None:
+        if dataclasses.is_dataclass(cls):
+            kind = _DATACLASS
+        elif getattr(cls, "__dictoffset__", 0) != 0:  # instances carry a __dict__
+            kind = _OBJECT
+        elif issubclass(cls, (list, tuple)):
+            kind = _SEQUENCE
+        elif issubclass(cls, dict):
+            kind = _MAPPING
+        else:
+            kind = _LEAF
+        _CONFIG_VALUE_KINDS[cls] = kind
+    return kind
+
+
+def _ndarray_to_json(array: NDArray[Any]) -> object:
+    """Convert an array for metadata.json, summarizing it when it is large."""
+    if array.size > METADATA_ARRAY_MAX_SIZE:
+        # Bulk data does not belong in metadata; avoid one Python object per element.
+        return {"__ndarray__": True, "shape": list(array.shape), "dtype": array.dtype.str}
+    return array.tolist()
+
+
+@singledispatch
+def _to_json(obj: object) -> object:
+    """``default`` hook for the JSON encoders, dispatched on ``type(obj)``.
+
+    singledispatch caches the implementation resolved for each concrete type, so
+    numpy scalars of any width cost one dict lookup after their first occurrence.
+    """
+    if hasattr(obj, "__dict__"):
+        return obj.__dict__
+    return str(obj)
+
+
+@_to_json.register
+def _(obj: np.ndarray) -> object:
+    return _ndarray_to_json(obj)
+
+
+@_to_json.register
+def _(obj: np.generic) -> object:
+    return obj.item()
+
 
 class ExpHandler(ABC, Generic[ObsType, RobotType, ConfigType, WorkerType]):
     def __init__(self, metadata_config: MetaDataConfig, fps: int) -> None:
-        self.metadata_config = metadata_config
         self.fps = fps
-        self.metadata_config.record_fps = self.fps
+        self.metadata_config = dataclasses.replace(metadata_config, record_fps=self.fps)
 
     @property
     @abstractmethod
@@ -134,18 +202,39 @@ class ExpHandler(ABC, Generic[ObsType, RobotType, ConfigType, WorkerType]):
     def save_metadata(self, save_path: str, data_shape: Dict[str, Any] | None = None) -> None:
         """Save metadata to JSON file."""
         metadata: dict[str, Any] = {}
-        metadata["task_details"] = self.metadata_config.__dict__
+        metadata["task_details"] = dataclasses.asdict(self.metadata_config)
         if data_shape:
             metadata["data_shape"] = data_shape
         metadata["robot_config"] = self._serialize_config(self.config)
 
-        with open(os.path.join(save_path, "metadata.json"), "w") as f:
-            json.dump(
+        if orjson is not None:
+            # numpy values still go through _json_serializer so large arrays are summarized.
+            payload = orjson.dumps(
                 metadata,
-                f,
-                indent=2,
                 default=self._json_serializer,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
             )
+        else:
+            payload = json.dumps(metadata, indent=2, default=self._json_serializer).encode("utf-8")
+        self._write_bytes(os.path.join(save_path, "metadata.json"), payload)
+
+    @staticmethod
+    def _write_bytes(file_path: str, payload: bytes) -> None:
+        """Write ``payload`` to ``file_path`` with raw ``os.write`` calls.
+
+        The bytes go to a temporary file next to ``file_path`` that is then renamed over
+        it, so an interrupted save never leaves a truncated file behind.
+        """
+        tmp_path = f"{file_path}.tmp"
+        flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+        fd = os.open(tmp_path, flags, 0o644)
+        try:
+            view = memoryview(payload)
+            while view:
+                view = view[os.write(fd, view) :]
+        finally:
+            os.close(fd)
+        os.replace(tmp_path, file_path)
 
     def record_save(
         self,
@@ -158,8 +247,9 @@ class ExpHandler(ABC, Generic[ObsType, RobotType, ConfigType, WorkerType]):
         """Record and save data loop."""
         try:
             print("Starting recording...")
-            if not self.robot.is_connected:
-                self.robot.connect()
+            # Resolve the property-backed worker once for the whole session.
+            save_all_obs = self.save_worker.save_all_obs
+            self._ensure_connected()
 
             while True:
                 print("Press 'Enter' to warm up , or 'q' to quit")
@@ -171,7 +261,7 @@ class ExpHandler(ABC, Generic[ObsType, RobotType, ConfigType, WorkerType]):
                     return
 
                 print(f"Warming up for default {warmup_time} seconds...")
-                self.robot.teleoperation(warmup_time)
+                self._warmup(warmup_time)
 
                 print("Press 'Enter' to start recording...")
                 input_str = input()
@@ -193,16 +283,11 @@ class ExpHandler(ABC, Generic[ObsType, RobotType, ConfigType, WorkerType]):
                     print("Recording again...")
                     continue
                 # save data
-                elif input_str in [str(i) for i in range(1, 10)]:
+                elif input_str in _VALID_SAVE_KEYS:
                     save_dir = os.path.join("data", f"{save_path}", f"{input_str}")
-                    count = 1
-                    unique_save_dir = save_dir + f"_{count}"
-                    while os.path.exists(unique_save_dir):
-                        unique_save_dir = f"{save_dir}_{count}"
-                        count += 1
-                    os.makedirs(unique_save_dir)
+                    unique_save_dir = self._make_unique_save_dir(save_dir)
 
-                    self.save_worker.save_all_obs(obs, unique_save_dir, save_gif)
+                    save_all_obs(obs, unique_save_dir, save_gif)
 
                     # Collect data shapes for metadata
                     data_shape = self._extract_data_shapes(obs)
@@ -221,6 +306,19 @@ class ExpHandler(ABC, Generic[ObsType, RobotType, ConfigType, WorkerType]):
             sleep(0.5)
             self.close()
 
+    def _ensure_connected(self) -> None:
+        """Connect the devices used by ``record_save`` if they are not connected yet."""
+        if not self.robot.is_connected:
+            self.robot.connect()
+
+    def _warmup(self, warmup_time: int) -> None:
+        """Teleoperate for ``warmup_time`` seconds before each recording.
+
+        Args:
+            warmup_time (int): Warmup duration in seconds.
+        """
+        self.robot.teleoperation(warmup_time)
+
     def record_save_with_fixed_leader(
         self,
         max_frame: int,
@@ -231,8 +329,11 @@ class ExpHandler(ABC, Generic[ObsType, RobotType, ConfigType, WorkerType]):
         """Record and save data with fixed leader action."""
         try:
             print("Starting recording with fixed leader action...")
-            if not self.robot.is_connected:
-                self.robot.connect()
+            # Resolve the property-backed robot and worker once for the whole session.
+            robot = self.robot
+            save_all_obs = self.save_worker.save_all_obs
+            if not robot.is_connected:
+                robot.connect()
 
             while True:
                 print("Press 'Enter' to start recording with fixed leader action, or 'q' to quit")
@@ -245,7 +346,7 @@ class ExpHandler(ABC, Generic[ObsType, RobotType, ConfigType, WorkerType]):
 
                 print("Recording with fixed leader action...")
 
-                obs = self.robot.record_with_fixed_leader(
+                obs = robot.record_with_fixed_leader(
                     max_frame=max_frame,
                     leader_action=leader_action,
                     fps=self.fps,
@@ -264,16 +365,11 @@ class ExpHandler(ABC, Generic[ObsType, RobotType, ConfigType, WorkerType]):
                     print("Recording again...")
                     continue
                 # save data
-                elif input_str in [str(i) for i in range(1, 10)]:
+                elif input_str in _VALID_SAVE_KEYS:
                     save_dir = os.path.join("data", f"{save_path}", f"{input_str}")
-                    count = 1
-                    unique_save_dir = save_dir + f"_{count}"
-                    while os.path.exists(unique_save_dir):
-                        unique_save_dir = f"{save_dir}_{count}"
-                        count += 1
-                    os.makedirs(unique_save_dir)
+                    unique_save_dir = self._make_unique_save_dir(save_dir)
 
-                    self.save_worker.save_all_obs(obs, unique_save_dir, save_gif)
+                    save_all_obs(obs, unique_save_dir, save_gif)
 
                     # Collect data shapes for metadata
                     data_shape = self._extract_data_shapes(obs)
@@ -293,42 +389,82 @@ class ExpHandler(ABC, Generic[ObsType, RobotType, ConfigType, WorkerType]):
             sleep(0.5)
             self.close()
 
+    @staticmethod
+    def _make_unique_save_dir(save_dir: str) -> str:
+        """Create and return the first free ``{save_dir}_{n}`` directory, counting from 1.
+
+        The used suffixes are read with a single directory scan of the parent instead
+        of one ``os.path.exists`` call per existing episode.
+        """
+        parent, base = os.path.split(save_dir)
+        pattern = re.compile(rf"{re.escape(base)}_(\d+)")
+        used: set[int] = set()
+        try:
+            with os.scandir(parent or ".") as entries:
+                for entry in entries:
+                    match = pattern.fullmatch(entry.name)
+                    if match:
+                        used.add(int(match.group(1)))
+        except FileNotFoundError:
+            pass
+
+        count = 1
+        while True:
+            while count in used:
+                count += 1
+            unique_save_dir = f"{save_dir}_{count}"
+            try:
+                os.makedirs(unique_save_dir, exist_ok=False)
+            except FileExistsError:
+                # Created concurrently since the scan; try the next suffix.
+                used.add(count)
+                continue
+            return unique_save_dir
+
     @staticmethod
     def _serialize_config(config_obj: object) -> dict[str, Any] | str:
         """Convert config object to JSON-serializable dictionary."""
-        if not hasattr(config_obj, "__dict__"):
+        kind = _config_value_kind(type(config_obj))
+        if kind == _DATACLASS:
+            return dataclasses.asdict(config_obj)  # type: ignore[call-overload]
+        if kind != _OBJECT:
             return str(config_obj)
 
-        result: Dict[str, object] = {}
-        for key, value in config_obj.__dict__.items():
-            if value is None:
-                result[key] = None
-            elif hasattr(value, "__dict__"):
-                result[key] = ExpHandler._serialize_config(value)
-            elif isinstance(value, (list, tuple)):
-                result[key] = [
-                    ExpHandler._serialize_config(item) if hasattr(item, "__dict__") else item
-                    for item in value
-                ]
-            elif isinstance(value, dict):
-                result[key] = {
-                    k: ExpHandler._serialize_config(v) if hasattr(v, "__dict__") else v
-                    for k, v in value.items()
-                }
-            else:
-                result[key] = value
-        return result
+        # Walk nested objects with an explicit worklist of (object, output dict) pairs.
+        # Objects shared by several fields (or referencing each other) are converted once.
+        pending: deque[tuple[object, Dict[str, object]]] = deque()
+        memo: Dict[int, object] = {}
+
+        def convert(value: object) -> object:
+            kind = _config_value_kind(type(value))
+            if kind != _DATACLASS and kind != _OBJECT:
+                return value
+            converted = memo.get(id(value))
+            if converted is None:
+                if kind == _DATACLASS:
+                    converted = dataclasses.asdict(value)  # type: ignore[call-overload]
+                else:
+                    converted = {}
+                    pending.append((value, converted))
+                memo[id(value)] = converted
+            return converted
+
+        root: Dict[str, object] = {}
+        memo[id(config_obj)] = root
+        pending.append((config_obj, root))
+        while pending:
+            obj, result = pending.popleft()
+            for key, value in obj.__dict__.items():
+                kind = _config_value_kind(type(value))
+                if kind == _SEQUENCE:
+                    result[key] = [convert(item) for item in value]
+                elif kind == _MAPPING:
+                    result[key] = {k: convert(v) for k, v in value.items()}
+                else:
+                    result[key] = convert(value)
+        return root
 
     @staticmethod
     def _json_serializer(obj: object) -> object:
         """JSON serializer for objects not serializable by default json code."""
-        import numpy as np
-
-        if isinstance(obj, np.ndarray):
-            return obj.tolist()
-        elif isinstance(obj, (np.integer, np.floating)):
-            return obj.item()
-        elif hasattr(obj, "__dict__"):
-            return obj.__dict__
-        else:
-            return str(obj)
+        return _to_json(obj)
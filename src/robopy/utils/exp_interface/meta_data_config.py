@@ -1,7 +1,7 @@
 from dataclasses import dataclass, field
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class MetaDataConfig:
     record_fps: int = field(default=10)
     task_name: str = field(default="")
@@ -1,5 +1,6 @@
-import logging
 import time
+from dataclasses import fields
+from logging import getLogger
 from time import sleep
 from typing import Any, Dict, List
 
@@ -7,8 +8,6 @@ import numpy as np
 from numpy import float32
 from numpy.typing import NDArray
 
-logger = logging.getLogger(__name__)
-
 from robopy.config import RakudaConfig, RakudaObs
 from robopy.config.robot_config.rakuda_config import RakudaSensorParams
 from robopy.config.sensor_config.params_config import CameraParams
@@ -18,6 +17,11 @@ from robopy.utils.worker.rakuda_save_worker import RakudaSaveWorker
 from .exp_handler import ExpHandler
 from .meta_data_config import MetaDataConfig
 
+logger = getLogger(__name__)
+
+# RakudaSensorObs fields recorded in the metadata data_shape section.
+_SENSOR_GROUPS = ("cameras", "tactile", "audio")
+
 
 class RakudaExpHandler(ExpHandler[RakudaObs, RakudaRobot, RakudaConfig, RakudaSaveWorker]):
     """This class handles the experimental interface for the Rakuda robot.
@@ -161,32 +165,20 @@ class RakudaExpHandler(ExpHandler[RakudaObs, RakudaRobot, RakudaConfig, RakudaSa
         return self._robot.config
 
     def _init_config(self, rakuda_config: RakudaConfig) -> RakudaConfig:
-        leader_port_num = rakuda_config.leader_port
-        follower_port_num = rakuda_config.follower_port
-        config: RakudaConfig = rakuda_config
-        cameras: List[CameraParams] = [
-            CameraParams(
-                name="main",
-                width=640,
-                height=480,
-                fps=30,
+        if rakuda_config.sensors is None:
+            return RakudaConfig(
+                leader_port=rakuda_config.leader_port,
+                follower_port=rakuda_config.follower_port,
+                sensors=RakudaSensorParams(cameras=self._default_cameras(), tactile=[], audio=[]),
             )
-        ]
-        if config.sensors is None:
-            config = RakudaConfig(
-                leader_port=leader_port_num,
-                follower_port=follower_port_num,
-                sensors=RakudaSensorParams(cameras=cameras, tactile=[], audio=[]),
-            )
-        else:
-            if len(config.sensors.cameras) == 0:
-                config.sensors.cameras = cameras  # default camera
-            if len(config.sensors.tactile) == 0:
-                config.sensors.tactile = []  # default no tactile
-            if len(config.sensors.audio) == 0:
-                config.sensors.audio = []  # default no audio
+        if not rakuda_config.sensors.cameras:
+            rakuda_config.sensors.cameras = self._default_cameras()
+        return rakuda_config
 
-        return config
+    @staticmethod
+    def _default_cameras() -> List[CameraParams]:
+        """Single 640x480 main camera used when the config lists no cameras."""
+        return [CameraParams(name="main", width=640, height=480, fps=30)]
 
     def _extract_data_shapes(self, obs: RakudaObs) -> dict[str, Any]:
         """Extract data shapes from observation for metadata.
@@ -212,37 +204,19 @@ class RakudaExpHandler(ExpHandler[RakudaObs, RakudaRobot, RakudaConfig, RakudaSa
             }
         """
         data_shape: Dict[str, Dict[str, Any]] = {}
-
-        # Extract arm data shapes
         if obs.arms is not None:
-            data_shape["arms"] = {}
-            for arm_name, arm_data in obs.arms.__dict__.items():
-                if arm_data is not None:
-                    data_shape["arms"][arm_name] = list(arm_data.shape)
-
-        # Extract sensor data shapes
+            data_shape["arms"] = {
+                arm.name: list(data.shape)
+                for arm in fields(obs.arms)
+                if (data := getattr(obs.arms, arm.name)) is not None
+            }
         if obs.sensors is not None:
-            data_shape["sensors"] = {}
-
-            # Extract camera shapes
-            if obs.sensors.cameras is not None:
-                data_shape["sensors"]["cameras"] = {}
-                for camera_name, camera_data in obs.sensors.cameras.items():
-                    if camera_data is not None:
-                        data_shape["sensors"]["cameras"][camera_name] = list(camera_data.shape)
-
-            # Extract tactile sensor shapes
-            if obs.sensors.tactile is not None:
-                data_shape["sensors"]["tactile"] = {}
-                for tactile_name, tactile_data in obs.sensors.tactile.items():
-                    if tactile_data is not None:
-                        data_shape["sensors"]["tactile"][tactile_name] = list(tactile_data.shape)
-
-            # Extract audio sensor shapes
-            if obs.sensors.audio is not None:
-                data_shape["sensors"]["audio"] = {}
-                for audio_name, audio_data in obs.sensors.audio.items():
-                    if audio_data is not None:
-                        data_shape["sensors"]["audio"][audio_name] = list(audio_data.shape)
+            data_shape["sensors"] = {
+                group: {
+                    name: list(data.shape) for name, data in streams.items() if data is not None
+                }
+                for group in _SENSOR_GROUPS
+                if (streams := getattr(obs.sensors, group)) is not None
+            }
 
         return data_shape
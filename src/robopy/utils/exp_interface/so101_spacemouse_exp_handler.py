@@ -120,73 +120,15 @@ class So101SpaceMouseExpHandler(ExpHandler[So101Obs, So101Robot, So101Config, So
             except Exception:
                 pass
 
-    def record_save(
-        self,
-        max_frames: int,
-        save_path: str,
-        if_async: bool = True,
-        save_gif: bool = True,
-        warmup_time: int = 5,
-    ) -> None:
-        """Interactive record-and-save loop using SpaceMouse.
-
-        Overrides the base class to use SpaceMouse teleoperation for the
-        warmup phase (instead of the leader-arm-based teleoperation).
-        """
-        import os
-
-        try:
-            print("Starting SpaceMouse recording session...")
-            if not self._controller.is_connected:
+    def _ensure_connected(self) -> None:
+        """Connect the SpaceMouse controller used by ``record_save`` if it is not connected yet."""
+        print("Starting SpaceMouse recording session...")
+        if not self._controller.is_connected:
+            try:
                 self._controller.connect()
+            except Exception as exc:
+                raise RuntimeError(f"Failed to record from SpaceMouse: {exc}") from exc
 
-            while True:
-                print("Press 'Enter' to warm up, or 'q' to quit")
-                input_str = input()
-                if input_str.lower() == "q":
-                    print("Exiting...")
-                    self.close()
-                    sleep(0.5)
-                    return
-
-                print(f"Warming up for {warmup_time} seconds (SpaceMouse active)...")
-                self._controller.teleoperation(max_seconds=warmup_time)
-
-                print("Press 'Enter' to start recording...")
-                input_str = input()
-                print("Recording with SpaceMouse...")
-
-                if if_async:
-                    print("Using asynchronous recording...")
-
-                obs = self.record(max_frames=max_frames, if_async=if_async)
-
-                print("Recording finished. Print 1~9 to save data, or 'e' to record again")
-                input_str = input()
-
-                if input_str.lower() == "e":
-                    print("Recording again...")
-                    continue
-                elif input_str in [str(i) for i in range(1, 10)]:
-                    save_dir = os.path.join("data", f"{save_path}", f"{input_str}")
-                    count = 1
-                    unique_save_dir = save_dir + f"_{count}"
-                    while os.path.exists(unique_save_dir):
-                        unique_save_dir = f"{save_dir}_{count}"
-                        count += 1
-                    os.makedirs(unique_save_dir)
-
-                    self.save_worker.save_all_obs(obs, unique_save_dir, save_gif)
-                    data_shape = self._extract_data_shapes(obs)
-                    self.save_metadata(unique_save_dir, data_shape)
-                else:
-                    print("Invalid input. Exiting...")
-                    self.close()
-                    return
-        except Exception as e:
-            self.close()
-            raise RuntimeError(f"Failed to record from SpaceMouse: {e}")
-        except KeyboardInterrupt:
-            print("Recording stopped by user...")
-            sleep(0.5)
-            self.close()
+    def _warmup(self, warmup_time: int) -> None:
+        """Teleoperate with the SpaceMouse instead of the leader arm during warmup."""
+        self._controller.teleoperation(max_seconds=warmup_time)
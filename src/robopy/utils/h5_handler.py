@@ -1,20 +1,73 @@
 import logging
+import math
+import os
+import zlib
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from logging import getLogger
-from typing import Any, Dict
+from typing import Any, Dict, Sequence
 
 import h5py
 import numpy as np
-from numpy.typing import NDArray
+from numpy.typing import DTypeLike, NDArray
+
+try:
+    # Importing hdf5plugin registers its filters with HDF5, so files written with
+    # "blosc:<codec>" can also be read in processes that never wrote one.
+    import hdf5plugin  # type: ignore
+except ModuleNotFoundError:  # pragma: no cover
+    hdf5plugin = None
 
 logger = getLogger(__name__)
 logger.setLevel(logging.INFO)
 
+# LZF ships with h5py and compresses several times faster than gzip, so files stay
+# readable by any h5py install while saving far less CPU time.
+DEFAULT_COMPRESSION = "lzf"
+
+# Target size of one chunk for datasets with fewer than three dimensions (arm data).
+STRIPE_NBYTES = 1024 * 1024
+
+# Minimum size of one chunk for frame stacks. Frames smaller than this (tactile, audio
+# mel frames) are grouped so a long recording is not split into thousands of chunks.
+MIN_CHUNK_NBYTES = 256 * 1024
+
+# Datasets smaller than this (e.g. short arm recordings) are stored without a filter:
+# their save time is dominated by per-dataset overhead, not by bytes written.
+UNCOMPRESSED_MAX_NBYTES = 64 * 1024
+
+# gzip datasets up to this size use the fastest level; larger ones use GZIP_LEVEL.
+GZIP_FAST_MAX_NBYTES = 4 * 1024 * 1024
+GZIP_LEVEL = 4
+
+# Oldest HDF5 file format written. 1.10 adds the fixed-array chunk index, which is
+# smaller and cheaper to write than the v1 B-tree for datasets that never grow.
+FILE_FORMAT_VERSION = "v110"
+
+# Raw-data chunk cache per open file. The HDF5 default of 1 MiB is smaller than a
+# single camera frame chunk, so chunks were evicted before they were complete.
+CHUNK_CACHE_NBYTES = 64 * 1024 * 1024
+CHUNK_CACHE_NSLOTS = 100003  # prime, roughly 100x the chunks the cache can hold
+
+# Shared by every save so frames are deflated without creating threads per dataset.
+# Worker threads are only started on first use.
+_DEFLATE_EXECUTOR = ThreadPoolExecutor(
+    max_workers=os.cpu_count() or 1, thread_name_prefix="h5-deflate"
+)
+
 
 class H5Handler:
     """Handler for saving and loading data using HDF5 format with h5py."""
 
     @staticmethod
-    def save_hierarchical(data_dict: Dict[str, Any], file_path: str, compress: bool = True) -> None:
+    def save_hierarchical(
+        data_dict: Dict[str, Any],
+        file_path: str,
+        compress: bool = True,
+        compression: str = DEFAULT_COMPRESSION,
+        chunk_map: Dict[str, tuple[int, ...]] | None = None,
+        rdcc_nbytes: int = CHUNK_CACHE_NBYTES,
+    ) -> None:
         """Save hierarchical data structure to HDF5 file.
 
         Args:
@@ -22,6 +75,13 @@ class H5Handler:
                 Can contain nested dicts and numpy arrays.
             file_path (str): Path to save the HDF5 file.
             compress (bool): Whether to use compression. Defaults to True.
+            compression (str): Compression filter used when ``compress`` is True: "lzf",
+                "gzip", or "blosc:<codec>" (e.g. "blosc:lz4", needs hdf5plugin).
+                Defaults to "lzf".
+            chunk_map (Dict[str, tuple[int, ...]] | None): Chunk shape overrides keyed by
+                dataset path, e.g. {"camera/main": (4, 3, 480, 640)}. Other datasets are
+                chunked one frame per chunk (3+ dims) or in ~1 MiB stripes. Defaults to None.
+            rdcc_nbytes (int): HDF5 raw-data chunk cache size in bytes. Defaults to 64 MiB.
 
         Example:
             data = {
@@ -40,56 +100,70 @@ class H5Handler:
             }
             H5Handler.save_hierarchical(data, 'output.h5')
         """
-        compression = "gzip" if compress else None
-        compression_opts = 4 if compress else None
+        filter_kwargs = H5Handler._filter_kwargs(compression if compress else None)
 
-        with h5py.File(file_path, "w") as f:
-            H5Handler._save_dict_to_group(f, data_dict, compression, compression_opts)
+        with H5Handler._open(file_path, "w", rdcc_nbytes) as f:
+            H5Handler._save_dict_to_group(f, data_dict, filter_kwargs, chunk_map or {})
             logger.info(f"Data saved to {file_path}")
 
     @staticmethod
     def _save_dict_to_group(
         group: h5py.Group,
         data_dict: Dict[str, Any],
-        compression: str | None = None,
-        compression_opts: int | None = None,
+        filter_kwargs: Dict[str, Any],
+        chunk_map: Dict[str, tuple[int, ...]],
     ) -> None:
-        """Recursively save dictionary to HDF5 group.
+        """Save a nested dictionary into an HDF5 group.
+
+        Nested dictionaries are walked with an explicit queue instead of recursion, and
+        each entry carries its dataset path so no group name has to be queried from HDF5.
 
         Args:
             group (h5py.Group): HDF5 group to save to.
             data_dict (Dict[str, Any]): Dictionary containing data.
-            compression (str | None): Compression algorithm.
-            compression_opts (int | None): Compression options.
+            filter_kwargs (Dict[str, Any]): Compression arguments for ``create_dataset``.
+            chunk_map (Dict[str, tuple[int, ...]]): Chunk shape overrides by dataset path.
         """
-        for key, value in data_dict.items():
-            if isinstance(value, dict):
-                # Create a subgroup for nested dictionaries
-                subgroup = group.create_group(key)
-                H5Handler._save_dict_to_group(subgroup, value, compression, compression_opts)
-            elif isinstance(value, (np.ndarray, list)):
-                # Save numpy arrays or lists as datasets
-                arr = np.asarray(value, dtype=np.float32)
-                if not arr.flags.c_contiguous:
-                    arr = np.ascontiguousarray(arr)
-                group.create_dataset(
-                    key,
-                    data=arr,
-                    compression=compression,
-                    compression_opts=compression_opts,
-                )
-            elif isinstance(value, (int, float, str, bytes)):
-                # Save scalar values as attributes
-                group.attrs[key] = value
-            else:
-                logger.warning(f"Skipping unsupported data type for key '{key}': {type(value)}")
+        pending = deque([(group, group.name.strip("/"), data_dict)])
+        while pending:
+            current, prefix, entries = pending.popleft()
+            for key, value in entries.items():
+                path = f"{prefix}/{key}" if prefix else key
+                if isinstance(value, dict):
+                    # Create a subgroup for nested dictionaries
+                    pending.append((current.create_group(key), path, value))
+                elif isinstance(value, (np.ndarray, list)):
+                    # Arrays keep their dtype (uint8 frames stay 8-bit); lists become float32.
+                    if isinstance(value, np.ndarray):
+                        arr = np.ascontiguousarray(value)
+                    else:
+                        arr = np.asarray(value, dtype=np.float32)
+                    chunks = chunk_map.get(path) or H5Handler._dataset_chunks(
+                        arr.shape, arr.itemsize
+                    )
+                    dataset_filter = H5Handler._sized_filter_kwargs(filter_kwargs, arr.nbytes)
+                    if (
+                        dataset_filter.get("compression") == "gzip"
+                        and chunks is not None
+                        and chunks[1:] == arr.shape[1:]
+                    ):
+                        H5Handler._write_deflate_frames(current, key, arr, chunks, dataset_filter)
+                    else:
+                        current.create_dataset(key, data=arr, chunks=chunks, **dataset_filter)
+                elif isinstance(value, (int, float, str, bytes)):
+                    # Save scalar values as attributes
+                    current.attrs[key] = value
+                else:
+                    logger.warning(f"Skipping unsupported data type for key '{key}': {type(value)}")
 
     @staticmethod
-    def load_hierarchical(file_path: str) -> Dict[str, Any]:
+    def load_hierarchical(file_path: str, dtype: DTypeLike | None = np.float32) -> Dict[str, Any]:
         """Load hierarchical data structure from HDF5 file.
 
         Args:
             file_path (str): Path to the HDF5 file.
+            dtype (DTypeLike | None): Dtype of the returned arrays. Defaults to float32.
+                Pass None to keep the stored dtype, e.g. uint8 camera and tactile frames.
 
         Returns:
             Dict[str, Any]: Hierarchical dictionary containing loaded data.
@@ -100,80 +174,240 @@ class H5Handler:
         """
         data_dict: Dict[str, Any] = {}
 
-        with h5py.File(file_path, "r") as f:
-            H5Handler._load_group_to_dict(f, data_dict)
+        with H5Handler._open(file_path, "r") as f:
+            H5Handler._load_group_to_dict(f, data_dict, dtype)
             logger.info(f"Data loaded from {file_path}")
 
         return data_dict
 
     @staticmethod
-    def _load_group_to_dict(group: h5py.Group, data_dict: Dict[str, Any]) -> None:
+    def _load_group_to_dict(
+        group: h5py.Group, data_dict: Dict[str, Any], dtype: DTypeLike | None
+    ) -> None:
         """Recursively load HDF5 group to dictionary.
 
         Args:
             group (h5py.Group): HDF5 group to load from.
             data_dict (Dict[str, Any]): Dictionary to populate.
+            dtype (DTypeLike | None): Dtype of the loaded arrays, or None for the stored dtype.
         """
         for key in group.keys():
             item = group[key]
             if isinstance(item, h5py.Group):
                 # Recursively load subgroups
                 data_dict[key] = {}
-                H5Handler._load_group_to_dict(item, data_dict[key])
+                H5Handler._load_group_to_dict(item, data_dict[key], dtype)
             elif isinstance(item, h5py.Dataset):
-                # Load datasets as numpy arrays
-                data_dict[key] = np.array(item, dtype=np.float32)
+                if dtype is None or item.dtype == dtype:
+                    data_dict[key] = item[()]
+                else:
+                    # HDF5 converts while reading, so no stored-dtype copy is made first.
+                    data_dict[key] = item.astype(dtype)[()]
 
     @staticmethod
     def save_single_array(
-        data: NDArray[np.float32],
+        data: NDArray[Any],
         file_path: str,
         dataset_name: str = "data",
         compress: bool = True,
+        compression: str = DEFAULT_COMPRESSION,
+        rdcc_nbytes: int = CHUNK_CACHE_NBYTES,
     ) -> None:
         """Save a single numpy array to HDF5 file.
 
         Args:
-            data (NDArray[np.float32]): Array to save.
+            data (NDArray[Any]): Array to save with its own dtype.
             file_path (str): Path to save the HDF5 file.
             dataset_name (str): Name of the dataset. Defaults to 'data'.
             compress (bool): Whether to use compression. Defaults to True.
+            compression (str): Compression filter used when ``compress`` is True. See
+                ``save_hierarchical``. Defaults to "lzf".
+            rdcc_nbytes (int): HDF5 raw-data chunk cache size in bytes. Defaults to 64 MiB.
         """
         if not data.flags.c_contiguous:
             data = np.ascontiguousarray(data)
 
-        compression = "gzip" if compress else None
-        compression_opts = 4 if compress else None
+        filter_kwargs = H5Handler._filter_kwargs(compression if compress else None)
 
-        with h5py.File(file_path, "w") as f:
-            f.create_dataset(
-                dataset_name,
-                data=data,
-                compression=compression,
-                compression_opts=compression_opts,
-            )
+        with H5Handler._open(file_path, "w", rdcc_nbytes) as f:
+            f.create_dataset(dataset_name, data=data, **filter_kwargs)
             logger.info(f"Array saved to {file_path}")
 
     @staticmethod
     def load_single_array(
         file_path: str,
         dataset_name: str = "data",
-    ) -> NDArray[np.float32]:
+        dtype: DTypeLike | None = np.float32,
+    ) -> NDArray[Any]:
         """Load a single numpy array from HDF5 file.
 
+        The dataset is read straight into the returned array, without an intermediate
+        copy for a dtype conversion.
+
         Args:
             file_path (str): Path to the HDF5 file.
             dataset_name (str): Name of the dataset. Defaults to 'data'.
+            dtype (DTypeLike | None): Convert to this dtype while reading. Defaults to
+                float32. Pass None to keep the stored dtype, e.g. uint8 camera frames.
 
         Returns:
-            NDArray[np.float32]: Loaded array.
+            NDArray[Any]: Loaded array.
         """
-        with h5py.File(file_path, "r") as f:
-            data = np.array(f[dataset_name], dtype=np.float32)
+        with H5Handler._open(file_path, "r") as f:
+            dataset = f[dataset_name]
+            data = np.empty(dataset.shape, dtype=dataset.dtype if dtype is None else dtype)
+            if data.size:
+                dataset.read_direct(data)
             logger.info(f"Array loaded from {file_path}")
 
         return data
 
+    @staticmethod
+    def save_external_links(file_path: str, target_path: str, dataset_paths: Sequence[str]) -> None:
+        """Create an HDF5 file whose datasets are external links into another file.
+
+        The target is referenced relative to ``file_path``, so a saved directory can
+        be moved as a whole.
+
+        Args:
+            file_path (str): Path of the link file to create.
+            target_path (str): Path of the HDF5 file holding the datasets.
+            dataset_paths (Sequence[str]): Dataset paths to link, e.g. "arm/leader". The
+                same paths are used in both files.
+        """
+        target = os.path.relpath(target_path, os.path.dirname(os.path.abspath(file_path)))
+        with h5py.File(file_path, "w") as f:
+            for dataset_path in dataset_paths:
+                f[dataset_path] = h5py.ExternalLink(target, "/" + dataset_path.strip("/"))
+        logger.info(f"Links to {target_path} saved to {file_path}")
+
+    @staticmethod
+    def _open(file_path: str, mode: str, rdcc_nbytes: int = CHUNK_CACHE_NBYTES) -> h5py.File:
+        """Open an HDF5 file with a chunk cache sized for whole frame chunks.
+
+        Every chunk is written or read exactly once, so ``rdcc_w0=1.0`` evicts fully
+        processed chunks first. New files use the HDF5 1.10 format, whose fixed-array
+        chunk index replaces the v1 B-tree for the fixed-size datasets written here;
+        they stay readable by HDF5 1.10 and newer.
+        """
+        return h5py.File(
+            file_path,
+            mode,
+            libver=(FILE_FORMAT_VERSION, "latest"),
+            rdcc_nbytes=rdcc_nbytes,
+            rdcc_nslots=CHUNK_CACHE_NSLOTS,
+            rdcc_w0=1.0,
+        )
+
+    @staticmethod
+    def _write_deflate_frames(
+        group: h5py.Group,
+        key: str,
+        arr: NDArray[Any],
+        chunks: tuple[int, ...],
+        filter_kwargs: Dict[str, Any],
+    ) -> None:
+        """Write a gzip dataset of whole-frame chunks, compressing chunks in parallel.
+
+        zlib releases the GIL, so the chunks are deflated on a thread pool and stored
+        with HDF5 direct chunk writes instead of going through the serial filter
+        pipeline. The chunks are in the standard deflate format, so the file reads
+        like any other gzip dataset.
+
+        Args:
+            group (h5py.Group): HDF5 group to create the dataset in.
+            key (str): Dataset name.
+            arr (NDArray[Any]): C-contiguous frame stack. Shape: (frames, ...)
+            chunks (tuple[int, ...]): Chunk shape, ``(frames_per_chunk, *arr.shape[1:])``.
+            filter_kwargs (Dict[str, Any]): gzip arguments for ``create_dataset``.
+        """
+        dataset = group.create_dataset(
+            key, shape=arr.shape, dtype=arr.dtype, chunks=chunks, **filter_kwargs
+        )
+        level = filter_kwargs.get("compression_opts", GZIP_LEVEL)
+        step = chunks[0]
+
+        def deflate(start: int) -> bytes:
+            block = arr[start : start + step]
+            if len(block) < step:
+                # HDF5 stores the edge chunk at full size, so pad the last frames.
+                padded = np.zeros(chunks, dtype=arr.dtype)
+                padded[: len(block)] = block
+                block = padded
+            return zlib.compress(block, level)
+
+        starts = range(0, len(arr), step)
+        origin = (0,) * (arr.ndim - 1)
+        for start, chunk in zip(starts, _DEFLATE_EXECUTOR.map(deflate, starts)):
+            dataset.id.write_direct_chunk((start, *origin), chunk)
+
+    @staticmethod
+    def _dataset_chunks(shape: tuple[int, ...], itemsize: int) -> tuple[int, ...] | None:
+        """Chunk shape for a dataset written once and read frame by frame.
+
+        Frame stacks with 3+ dimensions get whole frames per chunk, one per chunk for
+        camera-sized frames and as many as fit in MIN_CHUNK_NBYTES for smaller ones;
+        lower-dimensional time series get stripes of about STRIPE_NBYTES along the
+        leading axis.
+        """
+        if len(shape) == 0 or 0 in shape:
+            return None
+        row_nbytes = itemsize * math.prod(shape[1:])
+        target_nbytes = MIN_CHUNK_NBYTES if len(shape) >= 3 else STRIPE_NBYTES
+        return (max(1, min(shape[0], target_nbytes // row_nbytes)), *shape[1:])
+
+    @staticmethod
+    def _sized_filter_kwargs(filter_kwargs: Dict[str, Any], nbytes: int) -> Dict[str, Any]:
+        """Adapt the file-wide filter arguments to the size of one dataset.
+
+        Datasets under UNCOMPRESSED_MAX_NBYTES are written unfiltered, and gzip datasets
+        up to GZIP_FAST_MAX_NBYTES use level 1.
+
+        Args:
+            filter_kwargs (Dict[str, Any]): Arguments from ``_filter_kwargs``.
+            nbytes (int): Size of the dataset in bytes.
+
+        Returns:
+            Dict[str, Any]: Filter arguments for this dataset.
+        """
+        if not filter_kwargs or nbytes < UNCOMPRESSED_MAX_NBYTES:
+            return {}
+        if filter_kwargs.get("compression") == "gzip" and nbytes <= GZIP_FAST_MAX_NBYTES:
+            return {**filter_kwargs, "compression_opts": 1}
+        return filter_kwargs
+
+    @staticmethod
+    def _filter_kwargs(compression: str | None) -> Dict[str, Any]:
+        """Translate a compression name into ``create_dataset`` keyword arguments.
+
+        Args:
+            compression (str | None): "lzf", "gzip", "blosc:<codec>" or None for no
+                compression.
+
+        Returns:
+            Dict[str, Any]: Keyword arguments selecting the HDF5 filter.
+
+        Raises:
+            ValueError: If ``compression`` is not a supported filter name.
+            ImportError: If a Blosc filter is requested without hdf5plugin installed.
+        """
+        if compression is None:
+            return {}
+        if compression == "lzf":
+            return {"compression": "lzf"}
+        if compression == "gzip":
+            return {"compression": "gzip", "compression_opts": GZIP_LEVEL}
+        if compression.startswith("blosc:"):
+            if hdf5plugin is None:
+                raise ImportError(
+                    "Blosc compression for HDF5 requires hdf5plugin: pip install robopy[hdf5plugin]"
+                )
+            blosc_filter = hdf5plugin.Blosc(
+                cname=compression.removeprefix("blosc:"), clevel=5, shuffle=hdf5plugin.Blosc.SHUFFLE
+            )
+            return dict(blosc_filter)
+        raise ValueError(f"Unsupported HDF5 compression: {compression}")
+
     @staticmethod
     def get_info(file_path: str) -> Dict[str, Any]:
         """Get information about HDF5 file structure.
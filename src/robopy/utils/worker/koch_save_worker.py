@@ -49,6 +49,9 @@ class KochSaveWorker(SaveWorker[KochObs]):
                     follower,
                     task.save_path,
                 )
+            case "arm_link":
+                h5_path = cast(str, task.data)
+                return self._executor.submit(self._save_arm_links, h5_path, task.save_path)
             case "gif":
                 frames = cast(NDArray[np.float32], task.data)
                 return self._executor.submit(self._save_camera_gif, frames, task.save_path)
@@ -71,6 +74,13 @@ class KochSaveWorker(SaveWorker[KochObs]):
         H5Handler.save_hierarchical(hierarchical_data, arm_h5_path, compress=True)
         logger.info("Leaderアーム・FollowerアームのデータをHDF5形式で保存しました: %s", arm_h5_path)
 
+    def _save_arm_links(self, h5_path: str, path: str) -> None:
+        """統合HDF5内のアームデータへの外部リンクを ``path`` に書き出す."""
+        os.makedirs(path, exist_ok=True)
+        arm_h5_path = os.path.join(path, "koch_arm_observations.h5")
+        H5Handler.save_external_links(arm_h5_path, h5_path, ("arm/leader", "arm/follower"))
+        logger.info("アームデータへのリンクを保存しました: %s", arm_h5_path)
+
     def save_all_obs(self, obs: KochObs, save_path: str, save_gif: bool) -> None:
         """観測データをバックグラウンドで保存する."""
         os.makedirs(save_path, exist_ok=True)
@@ -86,18 +96,20 @@ class KochSaveWorker(SaveWorker[KochObs]):
             )
         )
 
+        # The arm data already lives in the combined file; the legacy arm file only links to it.
         self.enqueue_save_task(
             SaveTask(
-                task_type="arm",
-                data=(leader, follower),
+                task_type="arm_link",
+                data=h5_path,
                 save_path=os.path.join(save_path, "arm"),
             )
         )
 
         if save_gif:
             gif_root = os.path.join(save_path, "camera_gif")
+            preview_extension = self._preview_extension()
             for name, frames in camera_data.items():
-                gif_path = os.path.join(gif_root, name, f"{name}.gif")
+                gif_path = os.path.join(gif_root, name, f"{name}{preview_extension}")
                 self.enqueue_save_task(
                     SaveTask(
                         task_type="gif",
@@ -119,7 +131,13 @@ class KochSaveWorker(SaveWorker[KochObs]):
         if not os.path.exists(save_dir):
             os.makedirs(save_dir)
 
-        camera_data = {name: frames for name, frames in obs.cameras.items() if frames is not None}
+        # Color frames are 8-bit images carried as float32; store them as uint8.
+        # Depth frames ("<name>.depth") keep their dtype.
+        camera_data = {
+            name: frames if name.endswith(".depth") else self._to_uint8(frames)
+            for name, frames in obs.cameras.items()
+            if frames is not None
+        }
         if not camera_data:
             logger.warning("カメラデータが存在しません。")
 
@@ -128,24 +146,23 @@ class KochSaveWorker(SaveWorker[KochObs]):
         return camera_data, leader, follower
 
     def _save_camera_gif(self, frames: NDArray[np.float32] | NDArray[np.uint8], path: str) -> None:
-        """シンプルなGIFを書き出す."""
-        try:
-            import imageio.v2 as imageio
-        except ImportError:
-            logger.warning("imageio がインストールされていないため GIF 保存をスキップします。")
-            return
-
+        """カメラのプレビュー動画を書き出す (拡張子に応じてMP4またはGIF)."""
         os.makedirs(os.path.dirname(path), exist_ok=True)
         frame_data = frames
         if frame_data.shape[-3] == 3 or frame_data.shape[-3] == 1:
             frame_data = frame_data.transpose(0, 2, 3, 1)  # (N, C, H, W) -> (N, H, W, C)
         if frame_data.shape[-1] == 1:
             frame_data = frame_data[..., 0]  # (N, H, W, 1) -> (N, H, W)
-            frame_data = frame_data.astype(np.float32) / max(float(np.max(frame_data)), 1e-6) * 255
-        if frame_data.dtype != np.uint8:
-            frame_data = np.clip(frame_data, 0, 255).astype(np.uint8)
-        imageio.mimsave(path, list(frame_data), fps=self.fps)
-        logger.info("GIFを %s に保存しました。", path)
+            if frame_data.dtype != np.uint8:
+                # Stretch single-channel float frames (e.g. depth) to the 8-bit range,
+                # scaling and casting in one pass.
+                scale = 255.0 / max(float(np.max(frame_data)), 1e-6)
+                scaled = np.empty(frame_data.shape, dtype=np.uint8)
+                np.multiply(frame_data, scale, out=scaled, casting="unsafe")
+                frame_data = scaled
+        # Materialize the (N, H, W, C) uint8 layout once instead of per frame in the writer.
+        self._write_preview(self._to_uint8(frame_data), path, self.fps)
+        logger.info("プレビュー動画を %s に保存しました。", path)
 
     def _save_hierarchical_h5(self, data_dict: HierarchicalTaskData, file_path: str) -> None:
         H5Handler.save_hierarchical(data_dict, file_path, compress=True)
@@ -1,20 +1,15 @@
+from __future__ import annotations
+
 import os
-from concurrent.futures import Future
+from concurrent.futures import Future, ThreadPoolExecutor
 from logging import getLogger
-from typing import Dict, cast
-
-import matplotlib
-from rich.console import Console
-from rich.table import Table
+from types import ModuleType
+from typing import Dict, Iterator, cast
 
-matplotlib.use("Agg")  # thread safe backend
-
-import matplotlib.pyplot as plt
 import numpy as np
-from matplotlib.animation import FuncAnimation, PillowWriter
-from matplotlib.artist import Artist
-from matplotlib.image import AxesImage
 from numpy.typing import NDArray
+from rich.console import Console
+from rich.table import Table
 
 from robopy.config import RakudaConfig
 from robopy.config.robot_config.rakuda_config import RakudaObs
@@ -27,12 +22,30 @@ logger = getLogger(__name__)
 
 console = Console()
 
+# Height in pixels of the title and frame counter strips of the animation.
+LABEL_HEIGHT = 16
+# Width in pixels of the frame counter strip.
+COUNTER_WIDTH = 120
+
+
+def _pyplot() -> ModuleType:
+    """Import pyplot on first use so importing this module stays cheap."""
+    import matplotlib
+
+    matplotlib.use("Agg")  # thread safe backend
+    import matplotlib.pyplot as plt
+
+    return plt
+
 
 class RakudaSaveWorker(SaveWorker[RakudaObs]):
     def __init__(self, cfg: RakudaConfig, worker_num: int, fps: int) -> None:
         super().__init__(worker_num=worker_num)
         self.cfg = cfg
         self.fps = fps
+        # Animations are rendered on one dedicated thread so a long encode never holds
+        # up the HDF5 and plot writers in the shared pool.
+        self._render_executor: ThreadPoolExecutor | None = None
 
     def _process_task(self, task: SaveTask) -> Future[None] | None:
         match task.task_type:
@@ -60,24 +73,28 @@ class RakudaSaveWorker(SaveWorker[RakudaObs]):
             case "animation":
                 data = cast(
                     tuple[
-                        Dict[str, NDArray[np.float32]],
-                        Dict[str, NDArray[np.float32]],
+                        Dict[str, NDArray[np.uint8]],
+                        Dict[str, NDArray[np.uint8]],
                         Dict[str, NDArray[np.float32]],
                     ],
                     task.data,
                 )
-                camera_data, tactile_data, audio_data = data
+                camera_frames, tactile_frames, audio_data = data
                 logger.debug(f"Processing animation save task to {task.save_path}")
                 if (
-                    camera_data is not None
-                    and tactile_data is not None
+                    camera_frames is not None
+                    and tactile_frames is not None
                     and audio_data is not None
                     and task.fps is not None
                 ):
-                    return self._executor.submit(
-                        self.make_rakuda_obs_animation,
-                        camera_data,
-                        tactile_data,
+                    if self._render_executor is None:
+                        self._render_executor = ThreadPoolExecutor(
+                            max_workers=1, thread_name_prefix="rakuda-render"
+                        )
+                    return self._render_executor.submit(
+                        RakudaSaveWorker.make_rakuda_obs_animation,
+                        camera_frames,
+                        tactile_frames,
                         audio_data,
                         task.save_path,
                         task.fps,
@@ -109,17 +126,27 @@ class RakudaSaveWorker(SaveWorker[RakudaObs]):
                 logger.warning(f"Unknown task type: {task.task_type}")
                 return None
 
+    def shutdown(self) -> None:
+        super().shutdown()
+        if self._render_executor is not None:
+            logger.info("Waiting for animation rendering to finish...")
+            self._render_executor.shutdown(wait=True)
+
     def prepare_rakuda_obs(
         self, obs: RakudaObs, save_dir: str
     ) -> tuple[
-        Dict[str, NDArray[np.float32]],
-        Dict[str, NDArray[np.float32]],
+        Dict[str, NDArray[np.uint8]],
+        Dict[str, NDArray[np.uint8]],
         Dict[str, NDArray[np.float32]],
         NDArray[np.float32],
         NDArray[np.float32],
     ]:
         """Extract and prepare Rakuda sensor observation data for saving.
 
+        Camera and tactile frames are 8-bit color images carried as float32, so they are
+        narrowed back to uint8 here. This is lossless and quarters the bytes handed to
+        the HDF5 writer and to the animation process.
+
         Args:
             obs (RakudaObs): Observation data from Rakuda robot.
             save_dir (str): Directory to save the data.
@@ -140,11 +167,15 @@ class RakudaSaveWorker(SaveWorker[RakudaObs]):
                 raise ValueError("No sensor data available in the observation.")
 
             camera_data = {
-                name: data for name, data in sensors_data.cameras.items() if data is not None
+                name: self._to_uint8(data)
+                for name, data in sensors_data.cameras.items()
+                if data is not None
             }
 
             tactile_data = {
-                name: data for name, data in sensors_data.tactile.items() if data is not None
+                name: self._to_uint8(data)
+                for name, data in sensors_data.tactile.items()
+                if data is not None
             }
 
             audio_data = {
@@ -164,115 +195,150 @@ class RakudaSaveWorker(SaveWorker[RakudaObs]):
 
     @staticmethod
     def make_rakuda_obs_animation(
-        camera_data: Dict[str, NDArray[np.float32]],
-        tactile_data: Dict[str, NDArray[np.float32]],
+        camera_data: Dict[str, NDArray[np.uint8]],
+        tactile_data: Dict[str, NDArray[np.uint8]],
         audio_data: Dict[str, NDArray[np.float32]],
         save_dir: str,
         fps: int,
     ) -> None:
         """Generate and save animation from camera, tactile and audio sensor data.
 
+        Every panel is copied into one RGB canvas per frame with NumPy and the canvas is
+        streamed straight to the encoder, so no matplotlib figure is drawn per frame.
+
         Args:
-            camera_data (Dict[str, NDArray[np.float32]]): Camera data.
+            camera_data (Dict[str, NDArray[np.uint8]]): Camera data.
                 Shape: (frames, C, H, W)
-            tactile_data (Dict[str, NDArray[np.float32]]): Tactile sensor data.
+            tactile_data (Dict[str, NDArray[np.uint8]]): Tactile sensor data.
                 Shape: (frames, C, H, W)
             audio_data (Dict[str, NDArray[np.float32]]): Audio sensor data.
                 Shape: (frames, C, H, W)
-            save_dir (str): Directory to save the animation file.
+            save_dir (str): Path of the animation file. A ``.mp4`` path is encoded with
+                ffmpeg (H.264), anything else with Pillow as a GIF.
             fps (int): Frames per second for the animation.
         """
+        from matplotlib import colormaps, rcParams
+        from PIL import Image, ImageDraw
+
+        # (title, frames) per panel in display order: cameras, tactile, audio. Frames stay
+        # in their recorded layout; each one is converted while it is copied to the canvas.
+        panels: list[tuple[str, NDArray[np.uint8] | NDArray[np.float32]]] = [
+            *((f"Camera: {name}", data) for name, data in camera_data.items()),
+            *((f"Tactile Sensor: {name}", data) for name, data in tactile_data.items()),
+            *((f"Audio Sensor: {name}", data) for name, data in audio_data.items()),
+        ]
+        display_frame = RakudaSaveWorker._to_display_frame
+        colormap_index = RakudaSaveWorker._to_colormap_index
+        panel_sizes = [display_frame(frames[0]).shape for _, frames in panels]
+
+        num_frames = panels[0][1].shape[0]
+
+        cols = min(len(panels), 3)
+        rows = -(-len(panels) // cols)  # ceil division
+
+        # Single-channel panels (tactile, audio) are scaled to each frame's own value
+        # range and colored with the default imshow colormap.
+        colormap = colormaps[rcParams["image.cmap"]]
+        lut = (colormap(np.arange(256))[:, :3] * 255).astype(np.uint8)
+
+        # Layout: a frame counter strip on top, then a grid of cells, each with a
+        # title strip above the panel image.
+        cell_h = LABEL_HEIGHT + max(size[0] for size in panel_sizes)
+        cell_w = max(size[1] for size in panel_sizes)
+        layout = Image.new("RGB", (cols * cell_w, LABEL_HEIGHT + rows * cell_h))
+        draw = ImageDraw.Draw(layout)
+
+        regions: list[tuple[slice, slice]] = []
+        for index, ((title, _), size) in enumerate(zip(panels, panel_sizes)):
+            height, width = size[:2]
+            row, col = divmod(index, cols)
+            cell_top = LABEL_HEIGHT + row * cell_h
+            text_left = col * cell_w + (cell_w - draw.textlength(title)) / 2
+            draw.text((text_left, cell_top + 2), title, fill="white")
+            top = cell_top + LABEL_HEIGHT + (cell_h - LABEL_HEIGHT - height) // 2
+            left = col * cell_w + (cell_w - width) // 2
+            regions.append((slice(top, top + height), slice(left, left + width)))
+
+        # Titles are drawn once; only panel images and the counter change per frame.
+        canvas = np.array(layout)
+        updates = [
+            (canvas[region], frames, len(size) == 2)
+            for region, (_, frames), size in zip(regions, panels, panel_sizes)
+        ]
+        counter = canvas[:LABEL_HEIGHT, : min(canvas.shape[1], COUNTER_WIDTH)]
+        label = Image.new("RGB", (counter.shape[1], LABEL_HEIGHT))
+        label_draw = ImageDraw.Draw(label)
+
+        def render() -> Iterator[NDArray[np.uint8]]:
+            for frame_index in range(num_frames):
+                for region, frames, single_channel in updates:
+                    if single_channel:
+                        region[...] = lut[colormap_index(frames[frame_index])]
+                    else:
+                        region[...] = display_frame(frames[frame_index])
+                label_draw.rectangle(((0, 0), label.size), fill="black")
+                label_draw.text((4, 2), f"Frame: {frame_index}", fill="white")
+                counter[...] = np.asarray(label)
+                yield canvas
+
+        logger.info(f"Saving animation with {num_frames} frames...")
+        RakudaSaveWorker._write_preview(render(), save_dir, fps)
+        logger.info(f"Animation saved to {save_dir}")
 
-        logger.info("Starting batch preprocessing of animation data...")
+    @staticmethod
+    def _animation_filename() -> str:
+        """Pick the animation file name: MP4 when ffmpeg is installed, GIF otherwise."""
+        return "rakuda_obs_animation" + RakudaSaveWorker._preview_extension()
 
-        processed_camera = {}
-        for name, cam_data in camera_data.items():
-            cam_data = cam_data.transpose(0, 2, 3, 1)  # (N, C, H, W) -> (N, H, W, C)
-            processed_camera[name] = np.clip(cam_data / 255.0, 0, 1)
+    @staticmethod
+    def _to_display_frame(frame: NDArray[np.float32] | NDArray[np.uint8]) -> NDArray[np.uint8]:
+        """Convert one frame in the 0-255 range into a uint8 display frame.
 
-        for name, data in tactile_data.items():
-            data = data.transpose(0, 2, 3, 1)  # (N, C, H, W) -> (N, H, W, C)
-            tactile_data[name] = np.clip(data / 255.0, 0, 1)
+        uint8 frames are returned as a channels-last view without copying, so the
+        layout change happens in the copy to the animation canvas. Float frames are
+        clipped and cast to uint8 in a single pass.
 
-        for name, data in audio_data.items():
-            data = data.transpose(0, 2, 3, 1)  # (N, C, H, W) -> (N, H, W, C)
-            audio_data[name] = np.clip(data / 255.0, 0, 1)
-
-        camera_items = list(processed_camera.items())
-        tactile_items = list(tactile_data.items())
-        audio_items = list(audio_data.items())
-
-        num_frames = camera_items[0][1].shape[0]
-
-        all_fig_num = len(camera_items) + len(tactile_items) + len(audio_items)
-        rows = all_fig_num // 3 + int(all_fig_num % 3 != 0)
-        cols = min(all_fig_num, 3)
-
-        # Layout: multiple columns for cameras, tactile and audio sensors
-        fig = plt.figure(figsize=(5 * cols, 5 * rows))
-        axes = np.atleast_1d(fig.subplots(rows, cols)).ravel()
-
-        image_artists: list[AxesImage] = []
-
-        for index, (name, cam_data) in enumerate(camera_items):
-            axes[index].set_title(f"Camera: {name}")
-            axes[index].axis("off")
-            image_artists.append(axes[index].imshow(cam_data[0], animated=True))
-
-        for t_index, (name, tactile) in enumerate(tactile_items):
-            idx = len(camera_items) + t_index
-            axes[idx].set_title(f"Tactile Sensor: {name}")
-            axes[idx].axis("off")
-            image_artists.append(axes[idx].imshow(tactile[0], animated=True))
-
-        for a_index, (name, audio) in enumerate(audio_items):
-            idx = len(camera_items) + len(tactile_items) + a_index
-            axes[idx].set_title(f"Audio Sensor: {name}")
-            axes[idx].axis("off")
-            image_artists.append(axes[idx].imshow(audio[0], animated=True))
-
-        for unused_axis in axes[all_fig_num:]:
-            unused_axis.axis("off")
-
-        fps_text = fig.text(
-            0.02,
-            0.98,
-            "",
-            color="white",
-            bbox=dict(boxstyle="round,pad=0.3", facecolor="black", alpha=0.7),
-            verticalalignment="top",
-        )
+        Args:
+            frame (NDArray[np.float32] | NDArray[np.uint8]): Frame.
+                Shape: (C, H, W) or (H, W)
 
-        logger.info(f"Generating animation frames for {num_frames} frames...")
+        Returns:
+            NDArray[np.uint8]: Display frame. Shape: (H, W, 3) or (H, W) for one channel
+        """
+        if frame.ndim == 3:
+            frame = frame[0] if frame.shape[0] == 1 else frame[:3].transpose(1, 2, 0)
+        if frame.dtype == np.uint8:
+            return cast(NDArray[np.uint8], frame)
 
-        def update(frame_index: int) -> list[Artist]:
-            artist_list: list[Artist] = []
+        out = np.empty(frame.shape, dtype=np.uint8)
+        np.clip(frame, 0, 255, out=out, casting="unsafe")
+        return out
 
-            for index, (_, cam_data) in enumerate(camera_items):
-                image_artists[index].set_data(cam_data[frame_index])
-                artist_list.append(image_artists[index])
+    @staticmethod
+    def _to_colormap_index(frame: NDArray[np.float32] | NDArray[np.uint8]) -> NDArray[np.uint8]:
+        """Scale one single-channel frame to colormap indices over its own value range.
 
-            for t_index, (_, tactile) in enumerate(tactile_items):
-                artist_index = len(camera_items) + t_index
-                image_artists[artist_index].set_data(tactile[frame_index])
-                artist_list.append(image_artists[artist_index])
+        The frame's minimum maps to index 0 and its maximum to 255, as ``imshow`` does
+        with its default normalization, so low-amplitude spectrograms keep their
+        contrast. A constant frame maps to index 0.
 
-            for a_index, (_, audio) in enumerate(audio_items):
-                artist_index = len(camera_items) + len(tactile_items) + a_index
-                image_artists[artist_index].set_data(audio[frame_index])
-                artist_list.append(image_artists[artist_index])
+        Args:
+            frame (NDArray[np.float32] | NDArray[np.uint8]): Frame.
+                Shape: (1, H, W) or (H, W)
 
-            fps_text.set_text(f"Frame: {frame_index}")
-            artist_list.append(fps_text)
-            return artist_list
+        Returns:
+            NDArray[np.uint8]: Colormap indices. Shape: (H, W)
+        """
+        frame = frame.reshape(frame.shape[-2:])
+        low, high = frame.min(), frame.max()
+        if high <= low:
+            return np.zeros(frame.shape, dtype=np.uint8)
 
-        fig.tight_layout()
-        plt.subplots_adjust(wspace=0.1, top=0.85)
-        logger.info("Saving animation...")
-        ani = FuncAnimation(fig, update, frames=num_frames, interval=1000 / fps, blit=True)
-        ani.save(save_dir, writer=PillowWriter(fps=fps))
-        plt.close(fig)
-        logger.info(f"Animation saved to {save_dir}")
+        scaled = np.subtract(frame, low, dtype=np.float32)
+        scaled *= 256 / (float(high) - float(low))
+        out = np.empty(frame.shape, dtype=np.uint8)
+        np.minimum(scaled, 255, out=out, casting="unsafe")
+        return out
 
     @staticmethod
     def make_rakuda_arm_obs(
@@ -300,20 +366,20 @@ class RakudaSaveWorker(SaveWorker[RakudaObs]):
         if reshaped_leader.ndim != 2 or reshaped_follower.ndim != 2:
             raise ValueError("Arm data must be 2-dimensional (joints x frames).")
 
-        with plt.ioff():
+        plt = _pyplot()
+        frames = np.arange(reshaped_leader.shape[1])
+        # Chunked AGG rendering for long recordings
+        with plt.ioff(), plt.rc_context({"agg.path.chunksize": 10000}):
             fig = plt.figure(figsize=(8, 24))
-            axes = fig.subplots(n, 1)
+            axes = fig.subplots(n, 1, sharex=True, squeeze=False)[:, 0]
 
-            # Handle single axis case
-            if n == 1:
-                axes = [axes]
-
-            for i in range(n):
-                axes[i].clear()
-                axes[i].plot(reshaped_leader[i], alpha=0.8, linestyle="-")
-                axes[i].plot(reshaped_follower[i], alpha=0.8, linestyle="-.")
-                axes[i].set_title(f"Joint {i + 1}")
-                axes[i].grid(True, alpha=0.3)
+            for i, ax in enumerate(axes):
+                # Leader and follower traces in a single plot call per joint
+                ax.plot(
+                    frames, reshaped_leader[i], "-", frames, reshaped_follower[i], "-.", alpha=0.8
+                )
+                ax.set_title(f"Joint {i + 1}")
+                ax.grid(True, alpha=0.3)
 
             fig.legend(["Leader", "Follower"], loc="upper right")
             fig.tight_layout()
@@ -332,18 +398,7 @@ class RakudaSaveWorker(SaveWorker[RakudaObs]):
             camera_data (Dict[str, NDArray[np.float32]]): Camera data by name.
             save_path (str): Base path to save the camera data files.
         """
-        for name, data in camera_data.items():
-            if data is None:
-                continue
-            # Save each camera's data using BLOSC compression
-            file_path = os.path.join(save_path, "camera", name, f"{name}_camera_data.blosc")
-            if not os.path.exists(os.path.dirname(file_path)):
-                os.makedirs(os.path.dirname(file_path))
-            # Ensure array is C-contiguous before saving
-            if not data.flags.c_contiguous:
-                data = np.ascontiguousarray(data)
-            BLOSCHandler.save(data, file_path)
-            logger.info(f"Camera data for {name} saved to {file_path}")
+        self._save_sensor_data(camera_data, save_path, "camera")
 
     def _save_tactile_data(
         self,
@@ -356,19 +411,7 @@ class RakudaSaveWorker(SaveWorker[RakudaObs]):
             tactile_data (Dict[str, NDArray[np.float32]]): Tactile sensor data by name.
             save_path (str): Base path to save the tactile data files.
         """
-        for name, data in tactile_data.items():
-            if data is None:
-                continue
-            # Save each tactile sensor's data using BLOSC compression
-            file_path = os.path.join(save_path, "tactile", name, f"{name}_tactile_data.blosc")
-            if not os.path.exists(os.path.dirname(file_path)):
-                os.makedirs(os.path.dirname(file_path))
-            logger.info(f"tactile data shape: {data.shape}")
-            # Ensure array is C-contiguous before saving
-            if not data.flags.c_contiguous:
-                data = np.ascontiguousarray(data)
-            BLOSCHandler.save(data, file_path)
-            logger.info(f"Tactile data for {name} saved to {file_path}")
+        self._save_sensor_data(tactile_data, save_path, "tactile")
 
     def _save_audio_data(self, audio_data: Dict[str, NDArray[np.float32]], save_path: str) -> None:
         """Save audio sensor data using BLOSC compression.
@@ -377,29 +420,40 @@ class RakudaSaveWorker(SaveWorker[RakudaObs]):
             audio_data (Dict[str, NDArray[np.float32]]): Audio sensor data by name.
             save_path (str): Base path to save the audio data files.
         """
-        for name, data in audio_data.items():
+        self._save_sensor_data(audio_data, save_path, "audio")
+
+    def _save_sensor_data(
+        self, sensor_data: Dict[str, NDArray[np.float32]], save_path: str, kind: str
+    ) -> None:
+        """Save every stream of one sensor kind to ``{save_path}/{kind}/{name}/``.
+
+        Args:
+            sensor_data (Dict[str, NDArray[np.float32]]): Sensor data by name.
+            save_path (str): Base path to save the sensor data files.
+            kind (str): Sensor kind used in the directory and file names, e.g. "camera".
+        """
+        kind_dir = os.path.join(save_path, kind)
+        save = self._save_array_safe
+        for name, data in sensor_data.items():
             if data is None:
                 continue
-            # Save each audio sensor's data using BLOSC compression
-            file_path = os.path.join(save_path, "audio", name, f"{name}_audio_data.blosc")
-            if not os.path.exists(os.path.dirname(file_path)):
-                os.makedirs(os.path.dirname(file_path))
-            logger.info(f"audio data shape: {data.shape}")
-            # Ensure array is C-contiguous before saving
-            if not data.flags.c_contiguous:
-                data = np.ascontiguousarray(data)
-            BLOSCHandler.save(data, file_path)
-            logger.info(f"Audio data for {name} saved to {file_path}")
+            sensor_dir = os.path.join(kind_dir, name)
+            os.makedirs(sensor_dir, exist_ok=True)
+            file_path = os.path.join(sensor_dir, f"{name}_{kind}_data.blosc")
+            logger.info(f"{kind} data shape: {data.shape}")
+            save(data, file_path)
+            logger.info(f"{kind.capitalize()} data for {name} saved to {file_path}")
 
     def _save_array_safe(self, data: NDArray[np.float32], file_path: str) -> None:
-        """Safely save array with BLOSC, ensuring C-contiguous memory layout.
+        """Save an array with BLOSC.
+
+        Non-contiguous arrays (e.g. transposed views) are passed as they are: blosc2
+        gathers them chunk by chunk, so no full contiguous copy is made up front.
 
         Args:
             data (NDArray[np.float32]): Array to save.
             file_path (str): Path to save the array file.
         """
-        if not data.flags.c_contiguous:
-            data = np.ascontiguousarray(data)
         BLOSCHandler.save(data, file_path)
 
     def _save_hierarchical_h5(self, data_dict: HierarchicalTaskData, file_path: str) -> None:
@@ -414,8 +468,8 @@ class RakudaSaveWorker(SaveWorker[RakudaObs]):
 
     def _build_hierarchical_data(
         self,
-        camera_data: Dict[str, NDArray[np.float32]],
-        tactile_data: Dict[str, NDArray[np.float32]],
+        camera_data: Dict[str, NDArray[np.uint8]],
+        tactile_data: Dict[str, NDArray[np.uint8]],
         audio_data: Dict[str, NDArray[np.float32]],
         leader: NDArray[np.float32],
         follower: NDArray[np.float32],
@@ -423,8 +477,8 @@ class RakudaSaveWorker(SaveWorker[RakudaObs]):
         """Build hierarchical data structure for HDF5 storage.
 
         Args:
-            camera_data (Dict[str, NDArray[np.float32]]): Camera data by name.
-            tactile_data (Dict[str, NDArray[np.float32]]): Tactile sensor data by name.
+            camera_data (Dict[str, NDArray[np.uint8]]): Camera data by name.
+            tactile_data (Dict[str, NDArray[np.uint8]]): Tactile sensor data by name.
             audio_data (Dict[str, NDArray[np.float32]]): Audio sensor data by name.
             leader (NDArray[np.float32]): Leader arm positions.
             follower (NDArray[np.float32]): Follower arm positions.
@@ -443,14 +497,14 @@ class RakudaSaveWorker(SaveWorker[RakudaObs]):
         }
 
         # Add camera data to hierarchy
-        for name, data in camera_data.items():
-            if data is not None:
-                hierarchical_data["camera"][name] = data
+        for name, frames in camera_data.items():
+            if frames is not None:
+                hierarchical_data["camera"][name] = frames
 
         # Add tactile data to hierarchy
-        for name, data in tactile_data.items():
-            if data is not None:
-                hierarchical_data["tactile"][name] = data
+        for name, frames in tactile_data.items():
+            if frames is not None:
+                hierarchical_data["tactile"][name] = frames
 
         # Add audio data to hierarchy
         for name, data in audio_data.items():
@@ -467,7 +521,8 @@ class RakudaSaveWorker(SaveWorker[RakudaObs]):
         Args:
             obs (RakudaObs): Observation data to save.
             save_path (str): Directory path to save the data.
-            save_gif (bool): Whether to generate GIF animation.
+            save_gif (bool): Whether to generate the animation (MP4 if ffmpeg is
+                available, GIF otherwise).
         """
         camera_data, tactile_data, audio_data, leader, follower = self.prepare_rakuda_obs(
             obs, save_path
@@ -478,10 +533,10 @@ class RakudaSaveWorker(SaveWorker[RakudaObs]):
 
         table.add_row("Leader Arm Data", str(leader.shape))
         table.add_row("Follower Arm Data", str(follower.shape))
-        for name, data in camera_data.items():
-            table.add_row(f"Camera: {name}", str(data.shape))
-        for name, data in tactile_data.items():
-            table.add_row(f"Tactile Sensor: {name}", str(data.shape))
+        for name, frames in camera_data.items():
+            table.add_row(f"Camera: {name}", str(frames.shape))
+        for name, frames in tactile_data.items():
+            table.add_row(f"Tactile Sensor: {name}", str(frames.shape))
         for name, data in audio_data.items():
             table.add_row(f"Audio Sensor: {name}", str(data.shape))
         console.print(table)
@@ -514,13 +569,13 @@ class RakudaSaveWorker(SaveWorker[RakudaObs]):
             )
         )
 
-        # Generate GIF (optional)
+        # Generate animation (optional)
         if save_gif:
             self.enqueue_save_task(
                 SaveTask(
                     task_type="animation",
                     data=(camera_data, tactile_data, audio_data),
-                    save_path=os.path.join(save_path, "rakuda_obs_animation.gif"),
+                    save_path=os.path.join(save_path, self._animation_filename()),
                     fps=self.fps,
                 )
             )
@@ -540,11 +595,6 @@ class RakudaSaveWorker(SaveWorker[RakudaObs]):
         if not os.path.exists(path):
             os.makedirs(path)
 
-        # Ensure arrays are C-contiguous before saving
-        if not leader_obs.flags.c_contiguous:
-            leader_obs = np.ascontiguousarray(leader_obs)
-        if not follower_obs.flags.c_contiguous:
-            follower_obs = np.ascontiguousarray(follower_obs)
         leader_save_path = os.path.join(path, "arm", "leader", "leader_arm_data.blosc")
         follower_save_path = os.path.join(path, "arm", "follower", "follower_arm_data.blosc")
         if not os.path.exists(os.path.dirname(leader_save_path)):
@@ -1,10 +1,13 @@
 import concurrent.futures
+import itertools
 import queue
+import shutil
+import subprocess
 import threading
 from abc import ABC, abstractmethod
 from concurrent.futures import Future
 from logging import getLogger
-from typing import Any, Dict, Generic, NamedTuple, TypeAlias, TypeVar
+from typing import Any, Dict, Generic, Iterable, NamedTuple, TypeAlias, TypeVar
 
 import numpy as np
 from numpy.typing import NDArray
@@ -112,6 +115,125 @@ class SaveWorker(ABC, Generic[T]):
 
         logger.info("Background saver thread finished successfully")
 
+    @staticmethod
+    def _to_uint8(data: NDArray[np.float32] | NDArray[np.uint8]) -> NDArray[np.uint8]:
+        """Narrow 8-bit sensor frames stored as float to a C-contiguous uint8 array.
+
+        Args:
+            data (NDArray[np.float32] | NDArray[np.uint8]): Frames in the 0-255 range.
+
+        Returns:
+            NDArray[np.uint8]: Frames with the same shape as ``data``.
+        """
+        if data.dtype == np.uint8:
+            return np.ascontiguousarray(data)
+        out = np.empty(data.shape, dtype=np.uint8)
+        np.clip(data, 0, 255, out=out, casting="unsafe")
+        return out
+
+    @staticmethod
+    def _write_gif(frames: Iterable[NDArray[np.uint8]], path: str, fps: int) -> None:
+        """Write uint8 frames as a looping GIF with Pillow.
+
+        Color frames are quantized against one median-cut palette computed from the
+        first frame, instead of building a new palette for every frame. Frames are
+        consumed one at a time, so a generator may reuse one buffer for every frame.
+
+        Args:
+            frames (Iterable[NDArray[np.uint8]]): Frames of equal shape, e.g. a frame
+                stack. Frame shape: (H, W, 3) or (H, W)
+            path (str): Destination GIF path.
+            fps (int): Playback frame rate.
+        """
+        from PIL import Image
+
+        frame_iter = iter(frames)
+        first_frame = next(frame_iter)
+        if first_frame.ndim == 2:
+            first = Image.fromarray(first_frame)
+            images = (Image.fromarray(frame) for frame in frame_iter)
+        else:
+            first = Image.fromarray(first_frame).quantize(
+                colors=256, method=Image.Quantize.MEDIANCUT
+            )
+            images = (
+                Image.fromarray(frame).quantize(palette=first, dither=Image.Dither.NONE)
+                for frame in frame_iter
+            )
+        first.save(
+            path,
+            save_all=True,
+            append_images=images,
+            duration=int(1000 / fps),
+            loop=0,
+            optimize=False,
+            disposal=2,
+        )
+
+    @staticmethod
+    def _preview_extension() -> str:
+        """Pick the camera preview format: MP4 when ffmpeg is installed, GIF otherwise."""
+        return ".mp4" if shutil.which("ffmpeg") is not None else ".gif"
+
+    @staticmethod
+    def _write_preview(frames: Iterable[NDArray[np.uint8]], path: str, fps: int) -> None:
+        """Write uint8 frames as an MP4 or GIF preview, depending on the extension of ``path``.
+
+        Args:
+            frames (Iterable[NDArray[np.uint8]]): Frames of equal shape.
+                Frame shape: (H, W, 3) or (H, W)
+            path (str): Destination path ending in ``.mp4`` or ``.gif``.
+            fps (int): Playback frame rate.
+        """
+        if path.endswith(".mp4"):
+            SaveWorker._write_mp4(frames, path, fps)
+        else:
+            SaveWorker._write_gif(frames, path, fps)
+
+    @staticmethod
+    def _write_mp4(frames: Iterable[NDArray[np.uint8]], path: str, fps: int) -> None:
+        """Encode uint8 frames to H.264 MP4 by piping raw video into ffmpeg.
+
+        Color conversion and encoding run in ffmpeg's native, multi-threaded code, so
+        this is much faster than palette-quantizing every frame for a GIF. A frame stack
+        is written in one call; other iterables are streamed frame by frame.
+
+        Args:
+            frames (Iterable[NDArray[np.uint8]]): Frames of equal shape.
+                Frame shape: (H, W, 3) or (H, W)
+            path (str): Destination MP4 path.
+            fps (int): Playback frame rate.
+
+        Raises:
+            RuntimeError: If ffmpeg exits with an error.
+        """
+        if isinstance(frames, np.ndarray):
+            frame_shape, chunks = frames.shape[1:], iter((frames,))
+        else:
+            frame_iter = iter(frames)
+            first_frame = next(frame_iter)
+            frame_shape, chunks = first_frame.shape, itertools.chain((first_frame,), frame_iter)
+
+        height, width = frame_shape[:2]
+        pix_fmt = "gray" if len(frame_shape) == 2 else "rgb24"
+        # yuv420p needs even dimensions, so odd sizes are padded by one pixel.
+        command = (
+            f"ffmpeg -y -loglevel error -f rawvideo -pix_fmt {pix_fmt} -s {width}x{height}"
+            f" -r {fps} -i - -vf pad=ceil(iw/2)*2:ceil(ih/2)*2 -c:v libx264 -preset veryfast"
+            " -threads 0 -pix_fmt yuv420p"
+        ).split() + [path]
+        with subprocess.Popen(command, stdin=subprocess.PIPE, stderr=subprocess.PIPE) as process:
+            assert process.stdin is not None
+            try:
+                for chunk in chunks:
+                    # Hand ffmpeg the frame buffer itself instead of a bytes copy of it.
+                    process.stdin.write(memoryview(np.ascontiguousarray(chunk)).cast("B"))
+            except BrokenPipeError:
+                pass  # ffmpeg exited early; its error is reported below
+            _, stderr = process.communicate()
+        if process.returncode != 0:
+            raise RuntimeError(f"ffmpeg failed to write {path}: {stderr.decode().strip()}")
+
     @staticmethod
     def _log_future_result(task_type: str, future: Future[None]) -> None:
         try:
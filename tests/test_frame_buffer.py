@@ -0,0 +1,53 @@
+import numpy as np
+
+from robopy.robots.common.frame_buffer import FrameBuffer
+
+
+def test_frame_buffer_returns_full_buffer_without_copy() -> None:
+    buffer = FrameBuffer(max_frames=3)
+    frames = [np.full((2, 2), i, dtype=np.float32) for i in range(3)]
+    for index, frame in enumerate(frames):
+        buffer.put(index, frame)
+
+    result = buffer.result(3)
+
+    assert result is not None
+    assert result.dtype == np.float32
+    np.testing.assert_array_equal(result, np.stack(frames))
+
+
+def test_frame_buffer_trims_early_stop() -> None:
+    buffer = FrameBuffer(max_frames=10)
+    buffer.put(0, np.zeros(4, dtype=np.uint8))
+    buffer.put(1, np.ones(4, dtype=np.uint8))
+
+    result = buffer.result(2)
+
+    assert result is not None
+    assert result.shape == (2, 4)
+    assert result.base is None
+
+
+def test_frame_buffer_missing_frame_invalidates_stream() -> None:
+    buffer = FrameBuffer(max_frames=2)
+    buffer.put(0, np.zeros(4))
+    buffer.put(1, None)
+
+    assert buffer.result(2) is None
+    assert FrameBuffer(max_frames=2).result(0) is None
+
+
+def test_frame_buffer_late_first_frame_invalidates_stream() -> None:
+    buffer = FrameBuffer(max_frames=3)
+    buffer.put(1, np.ones(4))
+    buffer.put(2, np.ones(4))
+
+    assert buffer.result(3) is None
+
+
+def test_frame_buffer_skipped_index_invalidates_stream() -> None:
+    buffer = FrameBuffer(max_frames=3)
+    buffer.put(0, np.zeros(4))
+    buffer.put(2, np.zeros(4))
+
+    assert buffer.result(3) is None
@@ -0,0 +1,57 @@
+"""Tests for robopy.utils.blosc_handler."""
+
+from pathlib import Path
+
+import blosc2
+import numpy as np
+import pytest
+
+from robopy.utils.blosc_handler import CHUNK_NBYTES, BLOSCHandler
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        np.random.default_rng(0).uniform(0, 255, (12, 3, 48, 64)).astype(np.float32),
+        np.arange(40, dtype=np.float32).reshape(20, 2),
+        np.arange(5, dtype=np.uint8),
+        np.zeros((0, 3), dtype=np.float32),
+    ],
+)
+def test_save_load_roundtrip(tmp_path: Path, data: np.ndarray) -> None:
+    path = str(tmp_path / "data.blosc")
+    BLOSCHandler.save(data, path)
+    loaded = BLOSCHandler.load(path)
+
+    assert loaded.dtype == data.dtype
+    np.testing.assert_array_equal(loaded, data)
+
+
+def test_load_legacy_packed_file(tmp_path: Path) -> None:
+    data = np.arange(60, dtype=np.float32).reshape(5, 3, 4)
+    path = tmp_path / "legacy.blosc"
+    path.write_bytes(blosc2.pack_array2(data))
+
+    np.testing.assert_array_equal(BLOSCHandler.load(str(path)), data)
+
+
+def test_frame_chunks_bounded_by_target_size() -> None:
+    chunks = BLOSCHandler._frame_chunks((150, 3, 480, 640), 4)
+
+    assert chunks is not None
+    assert chunks[1:] == (3, 480, 640)
+    assert chunks[0] * 3 * 480 * 640 * 4 <= max(CHUNK_NBYTES, 3 * 480 * 640 * 4)
+
+
+def test_load_casts_to_requested_dtype(tmp_path: Path) -> None:
+    data = np.arange(24, dtype=np.uint8).reshape(2, 3, 4)
+    path = str(tmp_path / "frames.blosc")
+    BLOSCHandler.save(data, path, codec="lz4", clevel=5)
+
+    assert BLOSCHandler.load(path).dtype == np.uint8
+    assert BLOSCHandler.load(path, dtype=np.float32).dtype == np.float32
+
+
+def test_save_rejects_unknown_codec(tmp_path: Path) -> None:
+    with pytest.raises(ValueError):
+        BLOSCHandler.save(np.zeros(3), str(tmp_path / "bad.blosc"), codec="nope")
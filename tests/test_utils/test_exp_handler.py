@@ -0,0 +1,106 @@
+"""Tests for robopy.utils.exp_interface.exp_handler."""
+
+import json
+import os
+from pathlib import Path
+from types import SimpleNamespace
+
+import numpy as np
+
+from robopy.config import RakudaConfig
+from robopy.config.robot_config.rakuda_config import RakudaSensorParams
+from robopy.config.sensor_config.params_config import CameraParams
+from robopy.utils.exp_interface.exp_handler import METADATA_ARRAY_MAX_SIZE, ExpHandler
+from robopy.utils.exp_interface.meta_data_config import MetaDataConfig
+
+
+def test_serialize_dataclass_config() -> None:
+    camera = CameraParams(name="main", width=640, height=480, fps=30)
+    config = RakudaConfig("leader", "follower", sensors=RakudaSensorParams(cameras=[camera]))
+
+    result = ExpHandler._serialize_config(config)
+
+    assert isinstance(result, dict)
+    assert result["leader_port"] == "leader"
+    assert result["sensors"]["cameras"][0]["width"] == 640
+
+
+def test_serialize_nested_plain_objects() -> None:
+    config = SimpleNamespace(
+        rate=1,
+        inner=SimpleNamespace(items=[SimpleNamespace(value=None), 2]),
+        mapping={"key": SimpleNamespace(value=3)},
+    )
+
+    assert ExpHandler._serialize_config(config) == {
+        "rate": 1,
+        "inner": {"items": [{"value": None}, 2]},
+        "mapping": {"key": {"value": 3}},
+    }
+    assert ExpHandler._serialize_config(5) == "5"
+
+
+def test_json_serializer_summarizes_large_arrays() -> None:
+    small = np.arange(3, dtype=np.float32)
+    large = np.zeros((METADATA_ARRAY_MAX_SIZE + 1,), dtype=np.uint8)
+
+    assert ExpHandler._json_serializer(small) == [0.0, 1.0, 2.0]
+    assert ExpHandler._json_serializer(large) == {
+        "__ndarray__": True,
+        "shape": [METADATA_ARRAY_MAX_SIZE + 1],
+        "dtype": "|u1",
+    }
+
+
+def test_make_unique_save_dir_takes_first_free_suffix(tmp_path: Path) -> None:
+    save_dir = str(tmp_path / "1")
+    (tmp_path / "1_1").mkdir()
+    (tmp_path / "1_3").mkdir()
+
+    assert ExpHandler._make_unique_save_dir(save_dir) == f"{save_dir}_2"
+    assert ExpHandler._make_unique_save_dir(save_dir) == f"{save_dir}_4"
+    assert os.path.isdir(f"{save_dir}_4")
+
+
+def test_make_unique_save_dir_creates_missing_parent(tmp_path: Path) -> None:
+    save_dir = str(tmp_path / "task" / "2")
+
+    assert ExpHandler._make_unique_save_dir(save_dir) == f"{save_dir}_1"
+    assert os.path.isdir(f"{save_dir}_1")
+
+
+def test_save_metadata_writes_json(tmp_path: Path) -> None:
+    handler = SimpleNamespace(
+        metadata_config=MetaDataConfig(record_fps=5, task_name="pick"),
+        config=SimpleNamespace(port="COM1"),
+        _serialize_config=ExpHandler._serialize_config,
+        _json_serializer=ExpHandler._json_serializer,
+        _write_bytes=ExpHandler._write_bytes,
+    )
+    ExpHandler.save_metadata(handler, str(tmp_path), {"camera": [10, 3, 4, 4]})  # type: ignore[arg-type]
+
+    with open(tmp_path / "metadata.json", encoding="utf-8") as f:
+        metadata = json.load(f)
+
+    assert metadata["task_details"]["task_name"] == "pick"
+    assert metadata["data_shape"] == {"camera": [10, 3, 4, 4]}
+    assert metadata["robot_config"] == {"port": "COM1"}
+    assert sorted(os.listdir(tmp_path)) == ["metadata.json"]
+
+
+def test_json_serializer_converts_numpy_scalars() -> None:
+    assert ExpHandler._json_serializer(np.float32(1.5)) == 1.5
+    assert ExpHandler._json_serializer(np.int64(3)) == 3
+    assert ExpHandler._json_serializer(np.uint8(7)) == 7
+    assert ExpHandler._json_serializer(np.bool_(True)) is True
+
+
+def test_serialize_shared_objects_once() -> None:
+    shared = SimpleNamespace(value=1)
+    config = SimpleNamespace(first=shared, second=[shared])
+
+    result = ExpHandler._serialize_config(config)
+
+    assert isinstance(result, dict)
+    assert result == {"first": {"value": 1}, "second": [{"value": 1}]}
+    assert result["first"] is result["second"][0]
@@ -0,0 +1,137 @@
+"""Tests for robopy.utils.h5_handler."""
+
+from pathlib import Path
+
+import h5py
+import numpy as np
+import pytest
+
+from robopy.utils import h5_handler
+from robopy.utils.h5_handler import H5Handler
+
+
+def test_hierarchical_round_trip_keeps_dtypes(tmp_path: Path) -> None:
+    file_path = str(tmp_path / "data.h5")
+    frames = np.arange(24, dtype=np.uint8).reshape(2, 3, 2, 2)
+    leader = np.ones((2, 3), dtype=np.float32)
+
+    H5Handler.save_hierarchical(
+        {"tactile": {"left": frames}, "arm": {"leader": leader, "offsets": [1, 2]}}, file_path
+    )
+
+    with h5py.File(file_path, "r") as f:
+        assert f["tactile/left"].dtype == np.uint8
+        assert f["arm/offsets"].dtype == np.float32
+    loaded = H5Handler.load_hierarchical(file_path)
+    assert loaded["tactile"]["left"].dtype == np.float32
+    np.testing.assert_array_equal(loaded["tactile"]["left"], frames)
+    stored = H5Handler.load_hierarchical(file_path, dtype=None)
+    assert stored["tactile"]["left"].dtype == np.uint8
+    assert stored["arm"]["leader"].dtype == np.float32
+    np.testing.assert_array_equal(stored["tactile"]["left"], frames)
+
+
+def test_save_single_array_uses_requested_filter(tmp_path: Path) -> None:
+    data = np.arange(12, dtype=np.float32).reshape(4, 3)
+    lzf_path = str(tmp_path / "lzf.h5")
+    gzip_path = str(tmp_path / "gzip.h5")
+
+    H5Handler.save_single_array(data, lzf_path)
+    H5Handler.save_single_array(data, gzip_path, compression="gzip")
+
+    with h5py.File(lzf_path, "r") as f:
+        assert f["data"].compression == "lzf"
+    with h5py.File(gzip_path, "r") as f:
+        assert f["data"].compression == "gzip"
+    np.testing.assert_array_equal(H5Handler.load_single_array(lzf_path), data)
+
+
+def test_load_single_array_defaults_to_float32(tmp_path: Path) -> None:
+    file_path = str(tmp_path / "frames.h5")
+    frames = np.arange(24, dtype=np.uint8).reshape(2, 3, 4)
+    H5Handler.save_single_array(frames, file_path)
+
+    default = H5Handler.load_single_array(file_path)
+    stored = H5Handler.load_single_array(file_path, dtype=None)
+
+    assert default.dtype == np.float32
+    assert stored.dtype == np.uint8
+    np.testing.assert_array_equal(default, frames)
+    np.testing.assert_array_equal(stored, frames)
+
+
+def test_blosc_filter_requires_hdf5plugin(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(h5_handler, "hdf5plugin", None)
+
+    with pytest.raises(ImportError):
+        H5Handler._filter_kwargs("blosc:lz4")
+
+
+def test_filter_kwargs_rejects_unknown_compression() -> None:
+    assert H5Handler._filter_kwargs(None) == {}
+    with pytest.raises(ValueError):
+        H5Handler._filter_kwargs("zip")
+
+
+def test_save_hierarchical_chunks_whole_frames_with_overrides(tmp_path: Path) -> None:
+    file_path = str(tmp_path / "data.h5")
+    data = {
+        "camera": {
+            "main": np.zeros((2, 3, 256, 512), dtype=np.uint8),
+            "side": np.zeros((5, 3, 4, 4), dtype=np.uint8),
+        },
+        "audio": {"mel": np.zeros((5, 3, 4, 4), dtype=np.uint8)},
+        "arm": {"leader": np.zeros((5, 17), dtype=np.float32)},
+    }
+
+    H5Handler.save_hierarchical(data, file_path, chunk_map={"camera/side": (1, 3, 4, 4)})
+
+    with h5py.File(file_path, "r") as f:
+        assert f["camera/main"].chunks == (1, 3, 256, 512)
+        assert f["camera/side"].chunks == (1, 3, 4, 4)
+        assert f["audio/mel"].chunks == (5, 3, 4, 4)
+        assert f["arm/leader"].chunks == (5, 17)
+
+
+def test_gzip_frames_are_written_as_deflate_chunks(tmp_path: Path) -> None:
+    file_path = str(tmp_path / "data.h5")
+    # 12 KiB frames: 21 fit in one chunk, so the last chunk holds only 9 frames.
+    frames = np.random.default_rng(0).integers(0, 4, size=(30, 3, 64, 64), dtype=np.uint8)
+
+    H5Handler.save_hierarchical({"camera": {"main": frames}}, file_path, compression="gzip")
+
+    with h5py.File(file_path, "r") as f:
+        dataset = f["camera/main"]
+        assert dataset.compression == "gzip"
+        assert dataset.chunks == (21, 3, 64, 64)
+        np.testing.assert_array_equal(dataset[()], frames)
+
+
+def test_external_links_read_through_to_target(tmp_path: Path) -> None:
+    file_path = str(tmp_path / "observations.h5")
+    link_path = str(tmp_path / "arm" / "arm_observations.h5")
+    leader = np.arange(10, dtype=np.float32).reshape(5, 2)
+    follower = leader + 1
+    (tmp_path / "arm").mkdir()
+
+    H5Handler.save_external_links(link_path, file_path, ("arm/leader", "arm/follower"))
+    H5Handler.save_hierarchical({"arm": {"leader": leader, "follower": follower}}, file_path)
+
+    with h5py.File(link_path, "r") as f:
+        np.testing.assert_array_equal(f["arm"]["leader"][()], leader)
+        np.testing.assert_array_equal(f["arm"]["follower"][()], follower)
+
+
+def test_small_datasets_are_stored_unfiltered(tmp_path: Path) -> None:
+    file_path = str(tmp_path / "data.h5")
+    data = {
+        "arm": {"leader": np.zeros((50, 17), dtype=np.float32)},
+        "camera": {"main": np.zeros((8, 3, 64, 64), dtype=np.uint8)},
+    }
+
+    H5Handler.save_hierarchical(data, file_path, compression="gzip")
+
+    with h5py.File(file_path, "r") as f:
+        assert f["arm/leader"].compression is None
+        assert f["camera/main"].compression == "gzip"
+        assert f["camera/main"].compression_opts == 1
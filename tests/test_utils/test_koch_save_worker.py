@@ -0,0 +1,20 @@
+"""Tests for robopy.utils.worker.koch_save_worker."""
+
+from pathlib import Path
+
+import numpy as np
+from PIL import Image
+
+from robopy.utils.worker.koch_save_worker import KochSaveWorker
+
+
+def test_save_camera_gif_stretches_float_depth(tmp_path: Path) -> None:
+    worker = object.__new__(KochSaveWorker)
+    worker.fps = 10
+    depth = np.array([0.0, 1.0, 2.0, 4.0], dtype=np.float32).reshape(1, 1, 2, 2)
+    path = tmp_path / "depth" / "depth.gif"
+
+    worker._save_camera_gif(depth, str(path))
+
+    with Image.open(path) as image:
+        np.testing.assert_array_equal(np.asarray(image.convert("L")), [[0, 63], [127, 255]])
@@ -0,0 +1,28 @@
+"""Tests for robopy.utils.exp_interface.rakuda_exp_handler."""
+
+import numpy as np
+
+from robopy.config.robot_config.rakuda_config import RakudaArmObs, RakudaObs, RakudaSensorObs
+from robopy.utils.exp_interface.rakuda_exp_handler import RakudaExpHandler
+
+
+def test_extract_data_shapes_from_slotted_obs() -> None:
+    obs = RakudaObs(
+        arms=RakudaArmObs(
+            leader=np.zeros((4, 17), dtype=np.float32),
+            follower=np.zeros((4, 17), dtype=np.float32),
+        ),
+        sensors=RakudaSensorObs(
+            cameras={"main": np.zeros((4, 3, 8, 6), dtype=np.float32)},
+            tactile={"left": None},
+            audio={},
+        ),
+    )
+
+    shapes = RakudaExpHandler._extract_data_shapes(None, obs)  # type: ignore[arg-type]
+
+    assert shapes == {
+        "arms": {"leader": [4, 17], "follower": [4, 17]},
+        "sensors": {"cameras": {"main": [4, 3, 8, 6]}, "tactile": {}, "audio": {}},
+    }
+    assert not hasattr(obs, "__dict__")
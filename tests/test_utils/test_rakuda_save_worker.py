@@ -0,0 +1,91 @@
+"""Tests for robopy.utils.worker.rakuda_save_worker."""
+
+from pathlib import Path
+
+import numpy as np
+from PIL import Image
+
+from robopy.utils.blosc_handler import BLOSCHandler
+from robopy.utils.worker.rakuda_save_worker import LABEL_HEIGHT, RakudaSaveWorker
+
+
+def test_display_frame_from_float_chw() -> None:
+    data = np.array([-5.0, 12.7, 300.0], dtype=np.float32).reshape(3, 1, 1)
+
+    frame = RakudaSaveWorker._to_display_frame(data)
+
+    assert frame.dtype == np.uint8
+    assert frame.shape == (1, 1, 3)
+    np.testing.assert_array_equal(frame.ravel(), [0, 12, 255])
+
+
+def test_display_frame_views_uint8_and_squeezes_single_channel() -> None:
+    color = np.arange(24, dtype=np.uint8).reshape(4, 2, 3)
+    gray = np.arange(6, dtype=np.uint8).reshape(1, 2, 3)
+
+    color_frame = RakudaSaveWorker._to_display_frame(color)
+    gray_frame = RakudaSaveWorker._to_display_frame(gray)
+
+    assert color_frame.shape == (2, 3, 3)
+    assert np.shares_memory(color_frame, color)
+    np.testing.assert_array_equal(color_frame, color[:3].transpose(1, 2, 0))
+    assert gray_frame.shape == (2, 3)
+    np.testing.assert_array_equal(gray_frame, gray[0])
+
+
+def test_colormap_index_scales_each_frame_to_its_range() -> None:
+    quiet = np.array([[[0.0, 0.01], [0.02, 0.04]]], dtype=np.float32)
+    flat = np.full((2, 2), 7, dtype=np.uint8)
+
+    index = RakudaSaveWorker._to_colormap_index(quiet)
+
+    assert index.dtype == np.uint8
+    assert index.shape == (2, 2)
+    np.testing.assert_array_equal(index.ravel(), [0, 64, 128, 255])
+    np.testing.assert_array_equal(RakudaSaveWorker._to_colormap_index(flat), 0)
+
+
+def test_obs_animation_tiles_panels_into_gif(tmp_path: Path) -> None:
+    camera = np.full((3, 3, 8, 40), 200, dtype=np.uint8)
+    tactile = np.zeros((3, 1, 6, 6), dtype=np.uint8)
+    audio = np.zeros((3, 1, 4, 4), dtype=np.float32)
+    path = tmp_path / "anim.gif"
+
+    RakudaSaveWorker.make_rakuda_obs_animation(
+        {"main": camera}, {"left": tactile}, {"mic": audio}, str(path), fps=10
+    )
+
+    with Image.open(path) as image:
+        assert getattr(image, "n_frames", 1) == 3
+        assert image.size == (3 * 40, LABEL_HEIGHT + LABEL_HEIGHT + 8)
+
+
+def test_save_sensor_data_writes_one_file_per_stream(tmp_path: Path) -> None:
+    worker = object.__new__(RakudaSaveWorker)
+    data = np.arange(24, dtype=np.float32).reshape(2, 3, 2, 2)
+
+    worker._save_tactile_data({"left": data, "right": None}, str(tmp_path))  # type: ignore[dict-item]
+
+    file_path = tmp_path / "tactile" / "left" / "left_tactile_data.blosc"
+    np.testing.assert_array_equal(BLOSCHandler.load(str(file_path)), data)
+    assert not (tmp_path / "tactile" / "right").exists()
+
+
+def test_to_uint8_narrows_transposed_float_frames() -> None:
+    data = np.arange(24, dtype=np.float32).reshape(2, 2, 3, 2).transpose(0, 3, 1, 2)
+
+    frames = RakudaSaveWorker._to_uint8(data)
+
+    assert frames.dtype == np.uint8
+    assert frames.flags.c_contiguous
+    np.testing.assert_array_equal(frames, data)
+
+
+def test_save_array_safe_accepts_transposed_views(tmp_path: Path) -> None:
+    worker = object.__new__(RakudaSaveWorker)
+    data = np.arange(48, dtype=np.uint8).reshape(2, 2, 4, 3).transpose(0, 3, 1, 2)
+    file_path = str(tmp_path / "frames.blosc")
+
+    worker._save_array_safe(data, file_path)  # type: ignore[arg-type]
+
+    np.testing.assert_array_equal(BLOSCHandler.load(file_path), data)
@@ -0,0 +1,57 @@
+"""Tests for robopy.utils.worker.save_worker."""
+
+import shutil
+from pathlib import Path
+
+import numpy as np
+import pytest
+from PIL import Image
+
+from robopy.utils.worker.save_worker import SaveWorker
+
+
+def test_write_gif_color_and_grayscale(tmp_path: Path) -> None:
+    rng = np.random.default_rng(0)
+    color = rng.integers(0, 256, size=(4, 8, 6, 3), dtype=np.uint8)
+    gray = rng.integers(0, 256, size=(3, 8, 6), dtype=np.uint8)
+
+    SaveWorker._write_gif(color, str(tmp_path / "color.gif"), fps=10)
+    SaveWorker._write_gif(gray, str(tmp_path / "gray.gif"), fps=10)
+
+    with Image.open(tmp_path / "color.gif") as image:
+        assert getattr(image, "n_frames", 1) == 4
+        assert image.size == (6, 8)
+        assert image.info["duration"] == 100
+    with Image.open(tmp_path / "gray.gif") as image:
+        assert getattr(image, "n_frames", 1) == 3
+        np.testing.assert_array_equal(np.asarray(image.convert("L")), gray[0])
+
+
+def test_to_uint8_keeps_uint8_input() -> None:
+    frames = np.arange(6, dtype=np.uint8).reshape(1, 2, 3)
+
+    assert SaveWorker._to_uint8(frames) is frames
+
+
+def test_preview_falls_back_to_gif_without_ffmpeg(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(shutil, "which", lambda name: None)
+    path = str(tmp_path / f"preview{SaveWorker._preview_extension()}")
+
+    frames = np.arange(32, dtype=np.uint8).reshape(2, 4, 4)
+
+    SaveWorker._write_preview(frames, path, fps=10)
+
+    assert path.endswith(".gif")
+    with Image.open(path) as image:
+        assert getattr(image, "n_frames", 1) == 2
+
+
+@pytest.mark.skipif(shutil.which("ffmpeg") is None, reason="ffmpeg is not installed")
+def test_write_mp4_pads_odd_frame_sizes(tmp_path: Path) -> None:
+    path = tmp_path / "preview.mp4"
+
+    SaveWorker._write_mp4(np.zeros((3, 5, 7, 3), dtype=np.uint8), str(path), fps=10)
+
+    assert path.stat().st_size > 0